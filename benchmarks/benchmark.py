@@ -0,0 +1,308 @@
+"""
+End-to-end benchmark of min-req tox environments.
+
+The benchmark creates a static simple index with synthetic packages forming
+a layered dependency tree, a project depending on them, and measures
+the wall clock time of ``tox run`` and ``tox run-parallel`` with and without
+the min-req plugin. From the pip log of each environment the time spent on
+resolving (including downloads) and installing is reported. Parsing
+of the project dependencies is timed separately, as a micro-benchmark
+outside of tox.
+
+Usage::
+
+    python benchmarks/benchmark.py --save-baseline   # record baseline
+    python benchmarks/benchmark.py                   # compare with baseline
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import hashlib
+import inspect
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+
+from tox_min_req import parse_pyproject_toml
+from tox_min_req._install_report import pip_log_messages
+
+BASELINE_PATH = Path(__file__).parent / "baseline.json"
+VERSIONS = ("1.0.0", "1.1.0", "1.2.0", "1.3.0", "1.4.0", "1.5.0")
+PIP_LOG_NAME = "bench_pip.log"
+
+# the wheel of the project is written by the same write_wheel as the index packages,
+# its source is copied into the backend (see create_project)
+BACKEND_TEMPLATE = """
+from __future__ import annotations
+
+import base64
+import hashlib
+import zipfile
+from pathlib import Path
+
+REQUIRES = {requires!r}
+
+
+{write_wheel}
+
+def get_requires_for_build_wheel(config_settings=None):
+    return []
+
+
+def get_requires_for_build_sdist(config_settings=None):
+    return []
+
+
+def build_wheel(wheel_directory, config_settings=None, metadata_directory=None):
+    return write_wheel(Path(wheel_directory), "bench_project", "0.1.0", REQUIRES)
+"""
+
+PYPROJECT_TEMPLATE = """
+[build-system]
+requires = []
+build-backend = "backend"
+backend-path = ["."]
+
+[project]
+name = "bench_project"
+version = "0.1.0"
+dependencies = [
+{dependencies}
+]
+"""
+
+TOX_INI_TEMPLATE = """
+[tox]
+envlist = {envs}
+
+[testenv]
+base_python = {python}
+package = wheel
+setenv =
+    PIP_LOG={{env_dir}}/{pip_log}
+commands = python -c "import bench_project"
+"""
+
+
+def write_wheel(directory: Path, name: str, version: str, requires: list[str]) -> str:
+    """Write a minimal pure python wheel and return its file name."""
+    dist_info = f"{name}-{version}.dist-info"
+    metadata = f"Metadata-Version: 2.1\nName: {name}\nVersion: {version}\n"
+    metadata += "".join(f"Requires-Dist: {x}\n" for x in requires)
+    files = {
+        f"{name}/__init__.py": f"__version__ = {version!r}\n",
+        f"{dist_info}/METADATA": metadata,
+        f"{dist_info}/WHEEL": "Wheel-Version: 1.0\nRoot-Is-Purelib: true\n"
+        "Tag: py3-none-any\n",
+    }
+    file_name = f"{name}-{version}-py3-none-any.whl"
+    record = []
+    with zipfile.ZipFile(directory / file_name, "w") as f:
+        for path, content in files.items():
+            data = content.encode()
+            digest = base64.urlsafe_b64encode(hashlib.sha256(data).digest())
+            record.append(f"{path},sha256={digest.rstrip(b'=').decode()},{len(data)}")
+            f.writestr(path, data)
+        record.append(f"{dist_info}/RECORD,,")
+        f.writestr(f"{dist_info}/RECORD", "\n".join(record) + "\n")
+    return file_name
+
+
+def create_index(root: Path, layers: int, width: int, seed: int) -> list[str]:
+    """
+    Create a static simple index with a layered tree of synthetic packages.
+
+    Each version of a package depends on two packages of the next layer,
+    newer versions require newer versions of their dependencies.
+
+    :return: dependencies of the benchmarked project
+    """
+    rng = random.Random(seed)
+    files = root / "files"
+    files.mkdir(parents=True)
+    names = [[f"bench_{layer}_{i}" for i in range(width)] for layer in range(layers)]
+    for layer, layer_names in enumerate(names):
+        for name in layer_names:
+            deps = rng.sample(names[layer + 1], 2) if layer + 1 < layers else []
+            for i, version in enumerate(VERSIONS):
+                requires = [f"{dep}>={VERSIONS[i // 2]}" for dep in deps]
+                write_wheel(files, name, version, requires)
+    simple = root / "simple"
+    for layer_names in names:
+        for name in layer_names:
+            project = simple / name.replace("_", "-")
+            project.mkdir(parents=True)
+            links = "".join(
+                f'<a href="../../files/{x.name}">{x.name}</a>\n'
+                for x in sorted(files.glob(f"{name}-*.whl"))
+            )
+            (project / "index.html").write_text(f"<html><body>\n{links}</body></html>")
+    return [f"{name}>={rng.choice(VERSIONS[:3])}" for name in names[0]]
+
+
+def create_project(path: Path, dependencies: list[str], envs: int) -> list[str]:
+    """Create the benchmarked project and return names of its tox environments."""
+    path.mkdir()
+    env_names = [f"bench{i}" for i in range(envs)]
+    (path / "backend.py").write_text(
+        BACKEND_TEMPLATE.format(
+            requires=dependencies, write_wheel=inspect.getsource(write_wheel)
+        )
+    )
+    (path / "pyproject.toml").write_text(
+        PYPROJECT_TEMPLATE.format(
+            dependencies="\n".join(f'    "{x}",' for x in dependencies)
+        )
+    )
+    (path / "tox.ini").write_text(
+        TOX_INI_TEMPLATE.format(
+            envs=",".join(env_names), python=sys.executable, pip_log=PIP_LOG_NAME
+        )
+    )
+    return env_names
+
+
+def pip_phases(log_path: Path) -> tuple[float, float]:
+    """Get time spent on resolving (with downloads) and installing from the pip log."""
+    resolve = install = 0.0
+    start = install_start = None
+    if not log_path.exists():
+        return resolve, install
+    with log_path.open() as f:
+        for moment, message in pip_log_messages(f):
+            timestamp = moment.timestamp()
+            if message.startswith("Using pip "):
+                start = timestamp
+            elif message.startswith("Installing collected packages") and start:
+                resolve += timestamp - start
+                install_start = timestamp
+            elif message.startswith("Successfully installed") and install_start:
+                install += timestamp - install_start
+                start = install_start = None
+    return resolve, install
+
+
+def run_tox(
+    project: Path, index: Path, mode: str, min_req: bool, work_dir: Path
+) -> dict[str, float]:
+    """Run tox once and collect timings."""
+    env = {
+        **os.environ,
+        "PIP_INDEX_URL": (index / "simple").as_uri(),
+        "PIP_CACHE_DIR": str(work_dir / "pip_cache"),
+        "PIP_DISABLE_PIP_VERSION_CHECK": "1",
+        "MIN_REQ": "1" if min_req else "0",
+    }
+    if not min_req:
+        env["TOX_DISABLED_EXTERNAL_PLUGINS"] = "min-req"
+    cmd = [sys.executable, "-m", "tox", mode, "--workdir", str(work_dir / "tox")]
+    if mode == "run-parallel":
+        cmd += ["-p", "auto"]
+    start = time.perf_counter()
+    subprocess.run(cmd, cwd=project, env=env, check=True, stdout=subprocess.DEVNULL)
+    wall = time.perf_counter() - start
+    resolve = install = 0.0
+    for log_path in (work_dir / "tox").glob(f"*/{PIP_LOG_NAME}"):
+        env_resolve, env_install = pip_phases(log_path)
+        resolve += env_resolve
+        install += env_install
+    return {"wall": wall, "resolve": resolve, "install": install}
+
+
+def measure_parse(project: Path, repeat: int = 50) -> float:
+    """Measure the time of parsing the project dependencies."""
+    python_version = f"{sys.version_info[0]}.{sys.version_info[1]}"
+    python_full_version = ".".join(str(x) for x in sys.version_info[:3])
+    start = time.perf_counter()
+    for _ in range(repeat):
+        parse_pyproject_toml(
+            project / "pyproject.toml", python_version, python_full_version
+        )
+    return (time.perf_counter() - start) / repeat
+
+
+def run_benchmarks(args: argparse.Namespace) -> dict[str, dict[str, float]]:
+    """Run all scenarios and the parse micro-benchmark and return median timings."""
+    results: dict[str, dict[str, float]] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_path = Path(tmp)
+        dependencies = create_index(tmp_path / "index", args.layers, args.width, 0)
+        project = tmp_path / "project"
+        create_project(project, dependencies, args.envs)
+        results["pyproject.toml"] = {"parse": measure_parse(project)}
+        for mode in ("run", "run-parallel"):
+            for min_req in (False, True):
+                name = f"{mode} {'min-req' if min_req else 'plain'}"
+                runs = []
+                for i in range(args.repeat):
+                    work_dir = tmp_path / f"work_{mode}_{min_req}_{i}"
+                    runs.append(
+                        run_tox(project, tmp_path / "index", mode, min_req, work_dir)
+                    )
+                results[name] = {
+                    key: statistics.median(x[key] for x in runs) for key in runs[0]
+                }
+    return results
+
+
+def report(
+    results: dict[str, dict[str, float]], baseline: dict[str, dict[str, float]]
+) -> str:
+    """Format results, with relative change to the baseline if available."""
+    lines = []
+    sections = {
+        "tox scenario": ("wall", "resolve", "install"),
+        "micro-benchmark": ("parse",),
+    }
+    for title, keys in sections.items():
+        lines.append(f"{title:<22}" + "".join(f"{x:>18}" for x in keys))
+        for name, values in results.items():
+            if set(values) != set(keys):
+                continue
+            cells = []
+            for key in keys:
+                cell = f"{values[key]:.4f}s"
+                base = baseline.get(name, {}).get(key)
+                if base:
+                    cell += f" ({(values[key] - base) / base:+.0%})"
+                cells.append(f"{cell:>18}")
+            lines.append(f"{name:<22}" + "".join(cells))
+    return "\n".join(lines)
+
+
+def main() -> int:
+    """Run benchmark from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--envs", type=int, default=4, help="number of tox envs")
+    parser.add_argument("--layers", type=int, default=3, help="dependency tree depth")
+    parser.add_argument("--width", type=int, default=6, help="packages per layer")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per scenario")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="save results as the new baseline",
+    )
+    args = parser.parse_args()
+
+    results = run_benchmarks(args)
+    baseline = {}
+    if args.baseline.exists() and not args.save_baseline:
+        baseline = json.loads(args.baseline.read_text())
+    print(report(results, baseline))
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(results, indent=2) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import shutil
+import subprocess
+from typing import TYPE_CHECKING
+
+import pytest
+
+from tox_min_req._change_detection import files_hash, source_tree_hash
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_source_tree_hash(tmp_path: Path):
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "__init__.py").write_text("a = 1")
+    (tmp_path / ".tox").mkdir()
+    base_hash = source_tree_hash(tmp_path)
+
+    (tmp_path / ".tox" / "log.txt").write_text("ignored")
+    (tmp_path / "pkg" / "__pycache__").mkdir()
+    (tmp_path / "pkg" / "__pycache__" / "__init__.pyc").write_text("ignored")
+    assert source_tree_hash(tmp_path) == base_hash
+
+    (tmp_path / "coverage.xml").write_text("ignored")
+    (tmp_path / "venv").mkdir()
+    (tmp_path / "venv" / "pyvenv.cfg").write_text("ignored")
+    (tmp_path / "venv" / "module.py").write_text("ignored")
+    assert source_tree_hash(tmp_path) == base_hash
+
+    (tmp_path / "pkg" / "__init__.py").write_text("a = 2")
+    assert source_tree_hash(tmp_path) != base_hash
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+def test_source_tree_hash_git(tmp_path: Path):
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "__init__.py").write_text("a = 1")
+    (tmp_path / "pkg" / "data.json").write_text("{}")
+    subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+    subprocess.run(["git", "add", "pkg"], cwd=tmp_path, check=True)
+    base_hash = source_tree_hash(tmp_path)
+
+    (tmp_path / ".gitignore").write_text("coverage.xml\n")
+    subprocess.run(["git", "add", ".gitignore"], cwd=tmp_path, check=True)
+    base_hash = source_tree_hash(tmp_path)
+
+    (tmp_path / "coverage.xml").write_text("ignored")
+    (tmp_path / ".tox" / "py").mkdir(parents=True)
+    (tmp_path / ".tox" / "py" / "log.txt").write_text("not ignored, but skipped")
+    assert source_tree_hash(tmp_path) == base_hash
+
+    (tmp_path / "pkg" / "data.json").write_text("[]")
+    changed_hash = source_tree_hash(tmp_path)
+    assert changed_hash != base_hash
+
+    (tmp_path / "test_new.py").write_text("not added yet")
+    assert source_tree_hash(tmp_path) != changed_hash
+
+
+def test_files_hash(tmp_path: Path):
+    path = tmp_path / "constraints.txt"
+    missing_hash = files_hash([path])
+    path.write_text("six==1.13.0")
+    assert files_hash([path]) != missing_hash
+    assert files_hash([path]) == files_hash([path])
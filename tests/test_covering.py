@@ -0,0 +1,63 @@
+from itertools import combinations, product
+
+import pytest
+
+from tox_min_req._covering import covering_array, representative_versions
+
+PARAMETERS = {
+    "six": ["1.13.0", "1.14.0", "1.16.0"],
+    "click": ["7.1.2", "8.0.4", "8.1.7"],
+    "pytest": ["7.1.0", "7.4.4", "8.0.2", "8.3.3"],
+    "numpy": ["1.22.0", "2.1.0"],
+    "attrs": ["21.1.0", "23.2.0", "24.2.0"],
+}
+
+
+def _covered(rows, strength):
+    for names in combinations(sorted(PARAMETERS), strength):
+        for values in product(*(PARAMETERS[x] for x in names)):
+            if not any(all(row[n] == v for n, v in zip(names, values)) for row in rows):
+                return False
+    return True
+
+
+@pytest.mark.parametrize("strength", [1, 2, 3])
+def test_covering_array(strength):
+    rows = covering_array(PARAMETERS, strength=strength)
+
+    assert _covered(rows, strength)
+    assert all(set(row) == set(PARAMETERS) for row in rows)
+    assert len(rows) < len(list(product(*PARAMETERS.values())))
+
+
+def test_covering_array_pairwise_size():
+    rows = covering_array(PARAMETERS)
+    # at least all combinations of the two largest domains are needed
+    assert 4 * 3 <= len(rows) <= 4 * 3 + 4
+
+
+def test_covering_array_seed():
+    assert covering_array(PARAMETERS, seed=1) == covering_array(PARAMETERS, seed=1)
+    assert covering_array(PARAMETERS, seed=1) != covering_array(PARAMETERS, seed=2)
+
+
+def test_covering_array_empty():
+    assert covering_array({}) == []
+    assert covering_array({"six": [], "click": ["8.0.4"]}) == [{"click": "8.0.4"}]
+
+
+def test_representative_versions():
+    versions = ["1.0", "1.0.1", "1.1", "1.2.3", "1.2.5", "2.0", "2.1", "3.0", "3.1.2"]
+    assert representative_versions(versions, ">=1.0.1,!=2.0") == [
+        "1.0.1",
+        "1.2.5",
+        "2.1",
+        "3.1.2",
+    ]
+    assert representative_versions(versions, ">=1.0.1,<2", limit=10) == [
+        "1.0.1",
+        "1.1",
+        "1.2.5",
+    ]
+    assert representative_versions(versions, ">=4") == []
+    assert representative_versions(versions, ">=1.2", limit=2) == ["1.2.3", "3.1.2"]
@@ -0,0 +1,42 @@
+import threading
+
+import pytest
+
+from tox_min_req._ddmin import ddmin
+
+PINS = [f"package{i}" for i in range(30)]
+
+
+@pytest.mark.parametrize("jobs", [1, 4])
+def test_ddmin_single_culprit(jobs):
+    assert ddmin(PINS, lambda x: "package17" in x, jobs=jobs) == ["package17"]
+
+
+@pytest.mark.parametrize("jobs", [1, 4])
+def test_ddmin_interaction(jobs):
+    def test(subset):
+        return "package3" in subset and "package25" in subset
+
+    assert ddmin(PINS, test, jobs=jobs) == ["package3", "package25"]
+
+
+def test_ddmin_each_subset_tested_once():
+    tested = []
+    lock = threading.Lock()
+
+    def test(subset):
+        with lock:
+            tested.append(tuple(subset))
+        return {"package1", "package2", "package20"} <= set(subset)
+
+    result = ddmin(PINS, test, jobs=3)
+
+    assert result == ["package1", "package2", "package20"]
+    assert len(tested) == len(set(tested))
+    for pin in result:
+        assert not test([x for x in result if x != pin])
+
+
+def test_ddmin_small_input():
+    assert ddmin(["a"], bool) == ["a"]
+    assert ddmin([], lambda x: True) == []
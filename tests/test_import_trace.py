@@ -0,0 +1,44 @@
+import os
+import subprocess
+import sys
+
+from tox_min_req._import_trace import (
+    TRACE_DIR_ENV,
+    imported_distributions,
+    install_tracer,
+    read_traced_modules,
+    unused_dependencies,
+)
+
+
+def test_tracer(tmp_path):
+    site_packages = tmp_path / "site-packages"
+    site_packages.mkdir()
+    trace_dir = tmp_path / "trace"
+    trace_dir.mkdir()
+    install_tracer(site_packages)
+    code = f"import site; site.addsitedir({str(site_packages)!r}); import json.decoder"
+
+    subprocess.run([sys.executable, "-c", code], check=True)
+    assert read_traced_modules(trace_dir) == set()
+
+    env = {**os.environ, TRACE_DIR_ENV: str(trace_dir)}
+    subprocess.run([sys.executable, "-c", code], check=True, env=env)
+    modules = read_traced_modules(trace_dir)
+    assert "json" in modules
+    assert "decoder" not in modules
+    assert "_tox_min_req_trace" not in modules
+
+
+def test_imported_distributions():
+    distributions = imported_distributions(sys.executable, ["packaging", "json"])
+    assert distributions == {"packaging"}
+
+
+def test_unused_dependencies():
+    reports = [
+        {"declared": ["click", "six"], "imported": ["six", "pytest"]},
+        {"declared": ["numpy", "six"], "imported": []},
+    ]
+    assert unused_dependencies(reports) == ["click", "numpy"]
+    assert unused_dependencies(reports[:1]) == ["click"]
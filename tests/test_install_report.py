@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from tox_min_req._install_report import parse_pip_log
+
+PIP_LOG = """\
+2024-01-01T10:00:00,000 Using pip 23.2.1 from /venv/lib/python3.11/site-packages/pip
+2024-01-01T10:00:01,000 Collecting scipy==1.2.0
+2024-01-01T10:00:01,500   Downloading https://example.org/scipy-1.2.0.tar.gz (20 MB)
+2024-01-01T10:00:04,500   Added scipy==1.2.0 from https://example.org/scipy-1.2.0.tar.gz
+2024-01-01T10:00:05,000   Installing build dependencies: started
+2024-01-01T10:00:05,000   Running command pip subprocess to install build dependencies
+2024-01-01T10:00:05,100 Using pip 23.2.1 from /venv/lib/python3.11/site-packages/pip
+2024-01-01T10:00:05,200 Collecting numpy==1.16.0
+2024-01-01T10:00:05,300   Collecting numpy==1.16.0
+2024-01-01T10:00:05,400   Installing build dependencies: started
+2024-01-01T10:00:05,400   Running command pip subprocess to install build dependencies
+2024-01-01T10:00:05,400     Running command pip subprocess to install build dependencies
+2024-01-01T10:00:06,000   Installing build dependencies: finished with status 'done'
+2024-01-01T10:00:06,000     Installing build dependencies: finished with status 'done'
+2024-01-01T10:00:09,000 Successfully installed numpy-1.16.0
+2024-01-01T10:00:10,000   Installing build dependencies: finished with status 'done'
+2024-01-01T10:00:10,000   Getting requirements to build wheel: started
+2024-01-01T10:00:11,000   Getting requirements to build wheel: finished with status 'done'
+2024-01-01T10:00:11,000 Collecting six==1.13.0
+2024-01-01T10:00:11,000   Using cached six-1.13.0-py2.py3-none-any.whl (10 kB)
+2024-01-01T10:00:12,000 Building wheels for collected packages: scipy
+2024-01-01T10:00:12,000   Building wheel for scipy (pyproject.toml): started
+2024-01-01T10:09:12,000   Building wheel for scipy (pyproject.toml): finished with status 'done'
+2024-01-01T10:09:13,000 Installing collected packages: six, scipy
+2024-01-01T10:09:15,500 Successfully installed scipy-1.2.0 six-1.13.0
+"""
+
+
+def test_parse_pip_log():
+    report = parse_pip_log(PIP_LOG.splitlines(keepends=True))
+
+    assert report.to_json() == {
+        "packages": [{"name": "scipy", "download": 3.0, "build": 5.0 + 1.0 + 540.0}],
+        "install": 2.5,
+    }
+    assert report.format().splitlines()[1].startswith("scipy")
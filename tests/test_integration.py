@@ -1,6 +1,9 @@
+import json
 import os
 import shutil
+import subprocess
 import sys
+import zipfile
 from importlib.metadata import version
 from typing import TYPE_CHECKING
 
@@ -8,7 +11,20 @@ import pytest
 from packaging.version import parse as parse_version
 from tox.pytest import ToxProjectCreator, init_fixture  # noqa: F401
 
-from tox_min_req._tox_plugin import CONSTRAINTS_FILE_NAME
+from tox_min_req._import_trace import IMPORTS_FILE_NAME
+from tox_min_req._install_report import REPORT_FILE_NAME
+from tox_min_req._learned_pins import (
+    LEARNED_PINS_FILE_NAME,
+    LearnedPins,
+    project_key,
+)
+from tox_min_req._metadata_store import DistributionInfo, MetadataStore
+from tox_min_req._prefetch import PREFETCH_DIR_NAME
+from tox_min_req._tox_plugin import (
+    BUILD_CONSTRAINTS_FILE_NAME,
+    CONSTRAINTS_FILE_NAME,
+    _forget_installs,
+)
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -490,3 +506,637 @@ def test_warning_wrong_extras(
     with pytest.warns(UserWarning, match="Extra test8"):
         result = project.run("run")
     result.assert_success()
+
+
+def test_dry_run(
+    tox_project: ToxProjectCreator,
+    monkeypatch: pytest.MonkeyPatch,
+    data_dir: "Path",
+    tmp_path: "Path",
+) -> None:
+    monkeypatch.setenv("MIN_REQ", "1")
+    env = f"{sys.version_info[0]}{sys.version_info[1]}"
+    project = tox_project(
+        {
+            "tox.ini": TOX_INI_TEMPLATE.format(
+                env=env, extras="min_req_constraints=\n    babel==2.6.0"
+            ),
+            "pyproject.toml": PYPROJECT_TOML_TEMPLATE,
+            "test_file.py": TEST_FILE_TEMPLATE.format(cmp="=="),
+        },
+        base=data_dir / "package_data",
+    )
+    output_file = tmp_path / "min_req.json"
+
+    result = project.run("min-req-dry-run", "-o", str(output_file))
+
+    result.assert_success()
+    assert f"[py{env}]" in result.out
+    assert "six==1.13.0" in result.out
+    assert "babel==2.6.0" in result.out
+    assert json.loads(output_file.read_text())[f"py{env}"]["constraints"] == {
+        "six": "1.13.0",
+        "click": "7.1.2",
+        "pytest": "7.1.0",
+        "babel": "2.6.0",
+    }
+    assert not (project.path / ".tox" / f"py{env}").exists()
+
+
+def test_metadata_store_command(
+    tox_project: ToxProjectCreator,
+    data_dir: "Path",
+    tmp_path: "Path",
+) -> None:
+    env = f"{sys.version_info[0]}{sys.version_info[1]}"
+    project = tox_project(
+        {
+            "tox.ini": TOX_INI_TEMPLATE.format(env=env, extras=""),
+            "pyproject.toml": PYPROJECT_TOML_TEMPLATE,
+        },
+        base=data_dir / "package_data",
+    )
+    wheel_dir = tmp_path / "wheels"
+    wheel_dir.mkdir()
+    with zipfile.ZipFile(wheel_dir / "six-1.13.0-py3-none-any.whl", "w") as wheel:
+        wheel.writestr("six-1.13.0.dist-info/METADATA", "Name: six\nVersion: 1.13.0\n")
+    store_path = tmp_path / "store.sqlite"
+    export_path = tmp_path / "store.json"
+
+    result = project.run(
+        "min-req-store",
+        "--min-req-store-path",
+        str(store_path),
+        "--fill",
+        str(wheel_dir),
+        "--export",
+        str(export_path),
+    )
+
+    result.assert_success()
+    assert "added 1 wheels" in result.out
+    assert json.loads(export_path.read_text())[0]["version"] == "1.13.0"
+
+
+def test_install_report(
+    tox_project: ToxProjectCreator,
+    monkeypatch: pytest.MonkeyPatch,
+    data_dir: "Path",
+) -> None:
+    monkeypatch.setenv("MIN_REQ", "1")
+    env = f"{sys.version_info[0]}{sys.version_info[1]}"
+    project = tox_project(
+        {
+            "tox.ini": TOX_INI_TEMPLATE.format(
+                env=env, extras="min_req_install_report = true"
+            ),
+            "pyproject.toml": PYPROJECT_TOML_TEMPLATE,
+            "test_file.py": TEST_FILE_TEMPLATE.format(cmp="=="),
+        },
+        base=data_dir / "package_data",
+    )
+
+    result = project.run("run")
+
+    result.assert_success()
+    assert "min-req install cost" in result.out
+    report = json.loads(
+        (project.path / ".tox" / f"py{env}" / REPORT_FILE_NAME).read_text()
+    )
+    assert {"six", "click", "pytest"} <= {x["name"] for x in report["packages"]}
+
+
+TOX_INI_FACTORS = """
+[tox]
+envlist = py{env}-{{a,b}}{other}
+
+[testenv]
+extras = test
+min_req =
+    !c: 1
+    c: 0
+commands = pytest test_file.py
+"""
+
+
+def test_dry_run_matrix(
+    tox_project: ToxProjectCreator,
+    data_dir: "Path",
+    tmp_path: "Path",
+) -> None:
+    env = f"{sys.version_info[0]}{sys.version_info[1]}"
+    project = tox_project(
+        {
+            "tox.ini": TOX_INI_FACTORS.format(env=env, other=f",py{env}-c"),
+            "pyproject.toml": PYPROJECT_TOML_TEMPLATE,
+        },
+        base=data_dir / "package_data",
+    )
+    matrix_file = tmp_path / "matrix.json"
+
+    result = project.run("min-req-dry-run", "--matrix", str(matrix_file))
+
+    result.assert_success()
+    matrix = json.loads(matrix_file.read_text())
+    assert [(x["env"], x["duplicates"]) for x in matrix] == [
+        (f"py{env}-a", [f"py{env}-b"]),
+        (f"py{env}-c", []),
+    ]
+    assert f"# fingerprint: {matrix[0]['fingerprint']}" in result.out
+    assert matrix[1]["fingerprint"] is None
+
+
+@pytest.mark.parametrize(
+    "option",
+    ["extras =\n    a: test\n    b: test, other", "setenv =\n    b: QT_API=pyqt5"],
+)
+def test_dry_run_matrix_not_duplicates(
+    tox_project: ToxProjectCreator,
+    data_dir: "Path",
+    tmp_path: "Path",
+    option: str,
+) -> None:
+    env = f"{sys.version_info[0]}{sys.version_info[1]}"
+    project = tox_project(
+        {
+            "tox.ini": TOX_INI_FACTORS.format(env=env, other="").replace(
+                "extras = test", option
+            ),
+            "pyproject.toml": PYPROJECT_TOML_TEMPLATE.replace(
+                "[dependency-groups]", 'other = ["six"]\n\n[dependency-groups]'
+            ),
+        },
+        base=data_dir / "package_data",
+    )
+    matrix_file = tmp_path / "matrix.json"
+
+    result = project.run("min-req-dry-run", "--matrix", str(matrix_file))
+
+    result.assert_success()
+    matrix = json.loads(matrix_file.read_text())
+    assert [(x["env"], x["duplicates"]) for x in matrix] == [
+        (f"py{env}-a", []),
+        (f"py{env}-b", []),
+    ]
+
+
+def test_skip_duplicates(
+    tox_project: ToxProjectCreator,
+    data_dir: "Path",
+) -> None:
+    env = f"{sys.version_info[0]}{sys.version_info[1]}"
+    project = tox_project(
+        {
+            "tox.ini": TOX_INI_FACTORS.format(env=env, other=""),
+            "pyproject.toml": PYPROJECT_TOML_TEMPLATE,
+            "test_file.py": TEST_FILE_TEMPLATE.format(cmp="=="),
+        },
+        base=data_dir / "package_data",
+    )
+
+    result = project.run("run", "--min-req-skip-duplicates")
+
+    result.assert_success()
+    assert f"min-req environment is a duplicate of py{env}-a" in result.out
+
+
+def test_skip_unchanged(
+    tox_project: ToxProjectCreator,
+    monkeypatch: pytest.MonkeyPatch,
+    data_dir: "Path",
+) -> None:
+    monkeypatch.setenv("MIN_REQ", "1")
+    env = f"{sys.version_info[0]}{sys.version_info[1]}"
+    project = tox_project(
+        {
+            "tox.ini": TOX_INI_TEMPLATE.format(
+                env=env, extras="min_req_skip_unchanged = true"
+            ).replace("recreate = True", ""),
+            "pyproject.toml": PYPROJECT_TOML_TEMPLATE,
+            "test_file.py": TEST_FILE_TEMPLATE.format(cmp="=="),
+        },
+        base=data_dir / "package_data",
+    )
+
+    first = project.run("run")
+    second = project.run("run")
+    (project.path / "test_file.py").write_text(
+        TEST_FILE_TEMPLATE.format(cmp="==") + "\n# changed\n"
+    )
+    third = project.run("run")
+
+    first.assert_success()
+    second.assert_success()
+    third.assert_success()
+    assert "up to date" not in first.out
+    assert "min-req environment is up to date" in second.out
+    assert f"py{env}: OK" in second.out
+    assert "commands[0]" not in second.out
+    assert "up to date" not in third.out
+    assert "commands[0]" in third.out
+
+
+def test_prefetch(
+    tox_project: ToxProjectCreator,
+    monkeypatch: pytest.MonkeyPatch,
+    data_dir: "Path",
+) -> None:
+    monkeypatch.setenv("MIN_REQ", "1")
+    env = f"{sys.version_info[0]}{sys.version_info[1]}"
+    project = tox_project(
+        {
+            "tox.ini": TOX_INI_TEMPLATE.format(
+                env=env, extras="min_req_prefetch = true"
+            ),
+            "pyproject.toml": PYPROJECT_TOML_TEMPLATE,
+            "test_file.py": TEST_FILE_TEMPLATE.format(cmp="=="),
+        },
+        base=data_dir / "package_data",
+    )
+
+    result = project.run("run")
+
+    result.assert_success()
+    prefetch_dir = project.path / ".tox" / f"py{env}" / PREFETCH_DIR_NAME
+    assert {x.name.split("-")[0] for x in prefetch_dir.glob("*.whl")} >= {"six"}
+
+
+def test_learned_pins_applied(
+    tox_project: ToxProjectCreator,
+    monkeypatch: pytest.MonkeyPatch,
+    data_dir: "Path",
+) -> None:
+    monkeypatch.setenv("MIN_REQ", "1")
+    env = f"{sys.version_info[0]}{sys.version_info[1]}"
+    project = tox_project(
+        {
+            "tox.ini": TOX_INI_TEMPLATE.format(
+                env=env, extras="min_req_learn_pins = true"
+            ),
+            "pyproject.toml": PYPROJECT_TOML_TEMPLATE,
+        },
+        base=data_dir / "package_data",
+    )
+    key = project_key(
+        {"six": "1.13.0", "click": "7.1.2", "pytest": "7.1.0"},
+        f"{sys.version_info[0]}.{sys.version_info[1]}",
+    )
+    (project.path / ".tox").mkdir()
+    LearnedPins(project.path / ".tox" / LEARNED_PINS_FILE_NAME).add(
+        key, ["colorama==0.4.0", "test-package!=0.0.1"]
+    )
+
+    result = project.run("min-req-dry-run", "-o", "dry_run.json")
+
+    result.assert_success()
+    assert "colorama==0.4.0" in result.out
+    assert "test-package" not in result.out
+    data = json.loads((project.path / "dry_run.json").read_text())[f"py{env}"]
+    assert data["learned"] == ["colorama==0.4.0"]
+    assert data["extra_lines"] == []
+
+
+def test_watch_once(
+    tox_project: ToxProjectCreator,
+    monkeypatch: pytest.MonkeyPatch,
+    data_dir: "Path",
+) -> None:
+    monkeypatch.setenv("MIN_REQ", "1")
+    env = f"{sys.version_info[0]}{sys.version_info[1]}"
+    project = tox_project(
+        {
+            "tox.ini": TOX_INI_TEMPLATE.format(
+                env=env, extras="min_req_constraints=\n    babel==2.6.0"
+            ),
+            "pyproject.toml": PYPROJECT_TOML_TEMPLATE,
+            "test_file.py": TEST_FILE_TEMPLATE.format(cmp="=="),
+        },
+        base=data_dir / "package_data",
+    )
+    constraints_file = project.path / ".tox" / f"py{env}" / CONSTRAINTS_FILE_NAME
+
+    result = project.run("min-req-watch", "--once")
+
+    result.assert_success()
+    assert "updated" in result.out
+    content = constraints_file.read_text()
+    assert "six==1.13.0" in content
+    assert "babel==2.6.0" in content
+
+    result = project.run("min-req-watch", "--once")
+
+    result.assert_success()
+    assert "updated" not in result.out
+
+
+def test_build_env_pins(
+    tox_project: ToxProjectCreator,
+    monkeypatch: pytest.MonkeyPatch,
+    data_dir: "Path",
+) -> None:
+    monkeypatch.setenv("MIN_REQ_BUILD", "1")
+    env = f"{sys.version_info[0]}{sys.version_info[1]}"
+    pyproject = PYPROJECT_TOML_TEMPLATE.replace(
+        'requires = ["setuptools", "wheel"]', 'requires = ["setuptools>=68.0.0"]'
+    )
+    project = tox_project(
+        {
+            "tox.ini": f"[tox]\nenvlist = py{env}\n[testenv]\ncommands = python -V\n",
+            "pyproject.toml": pyproject,
+        },
+        base=data_dir / "package_data",
+    )
+    pkg_dir = project.path / ".tox" / ".pkg"
+    pkg_python = pkg_dir / ("Scripts" if sys.platform == "win32" else "bin") / "python"
+    get_version = [
+        str(pkg_python),
+        "-c",
+        "import setuptools;print(setuptools.__version__)",
+    ]
+
+    result = project.run("run")
+
+    result.assert_success()
+    assert (pkg_dir / BUILD_CONSTRAINTS_FILE_NAME).read_text() == "setuptools==68.0.0\n"
+    assert subprocess.check_output(get_version, text=True).strip() == "68.0.0"
+
+    (project.path / "pyproject.toml").write_text(
+        pyproject.replace("setuptools>=68.0.0", "setuptools>=69.0.0")
+    )
+    result = project.run("run")
+
+    result.assert_success()
+    assert "min-req build pins changed" in result.out
+    assert subprocess.check_output(get_version, text=True).strip() == "69.0.0"
+
+
+def test_dry_run_subset(
+    tox_project: ToxProjectCreator,
+    monkeypatch: pytest.MonkeyPatch,
+    data_dir: "Path",
+) -> None:
+    monkeypatch.setenv("MIN_REQ", "1")
+    monkeypatch.setenv("TOX_MIN_REQ_SUBSET", "Six,pytest")
+    env = f"{sys.version_info[0]}{sys.version_info[1]}"
+    project = tox_project(
+        {
+            "tox.ini": TOX_INI_TEMPLATE.format(env=env, extras=""),
+            "pyproject.toml": PYPROJECT_TOML_TEMPLATE,
+        },
+        base=data_dir / "package_data",
+    )
+
+    result = project.run("min-req-dry-run")
+
+    result.assert_success()
+    assert "six==1.13.0" in result.out
+    assert "pytest==7.1.0" in result.out
+    assert "click==" not in result.out
+
+
+def test_bisect(
+    tox_project: ToxProjectCreator,
+    monkeypatch: pytest.MonkeyPatch,
+    data_dir: "Path",
+) -> None:
+    monkeypatch.setenv("MIN_REQ", "1")
+    env = f"{sys.version_info[0]}{sys.version_info[1]}"
+    project = tox_project(
+        {
+            "tox.ini": TOX_INI_TEMPLATE.format(env=env, extras="").replace(
+                "recreate = True\n", ""
+            ),
+            "pyproject.toml": PYPROJECT_TOML_TEMPLATE,
+            "test_file.py": "import six\n\n"
+            "def test_six():\n"
+            '    assert six.__version__ != "1.13.0"\n',
+        },
+        base=data_dir / "package_data",
+    )
+
+    result = project.run("min-req-bisect", "--jobs", "2")
+
+    result.assert_success()
+    assert "minimal set of pins reproducing the failure: six==1.13.0" in result.out
+
+
+def test_forget_installs(tmp_path: "Path") -> None:
+    info = {
+        "ToxEnv": {"name": "py", "type": "VirtualEnvRunner"},
+        "Python": {"version_info": [3, 8, 10, "final", 0]},
+        "PythonRun": {"deps": {"deps": ["pytest"]}},
+        "RunToxEnv": {"package_deps": {"deps": ["six>=1.13.0"]}},
+    }
+    (tmp_path / ".tox-info.json").write_text(json.dumps(info))
+
+    _forget_installs(tmp_path)
+    _forget_installs(tmp_path / "missing")
+
+    assert json.loads((tmp_path / ".tox-info.json").read_text()) == {
+        "ToxEnv": info["ToxEnv"],
+        "Python": info["Python"],
+    }
+
+
+def test_trace_imports(
+    tox_project: ToxProjectCreator,
+    monkeypatch: pytest.MonkeyPatch,
+    data_dir: "Path",
+) -> None:
+    monkeypatch.setenv("MIN_REQ", "1")
+    env = f"{sys.version_info[0]}{sys.version_info[1]}"
+    project = tox_project(
+        {
+            "tox.ini": TOX_INI_TEMPLATE.format(
+                env=env,
+                extras="min_req_trace_imports = true\n"
+                "min_req_constraints =\n    babel==2.6.0",
+            ),
+            "pyproject.toml": PYPROJECT_TOML_TEMPLATE,
+            "test_file.py": "import six\n\ndef test_six():\n    assert six\n",
+        },
+        base=data_dir / "package_data",
+    )
+
+    result = project.run("run")
+
+    result.assert_success()
+    assert "min-req dependencies not imported by commands: click" in result.out
+    report = json.loads(
+        (project.path / ".tox" / f"py{env}" / IMPORTS_FILE_NAME).read_text()
+    )
+    assert {"six", "pytest"} <= set(report["imported"])
+    assert "click" in report["declared"]
+    assert "babel" not in report["declared"]
+
+    result = project.run("min-req-imports")
+
+    result.assert_success()
+    assert "not imported in any environment: click" in result.out
+
+
+def test_snapshot_export_import(
+    tox_project: ToxProjectCreator,
+    monkeypatch: pytest.MonkeyPatch,
+    data_dir: "Path",
+    tmp_path: "Path",
+) -> None:
+    monkeypatch.setenv("MIN_REQ", "1")
+    env = f"{sys.version_info[0]}{sys.version_info[1]}"
+    project = tox_project(
+        {
+            "tox.ini": TOX_INI_TEMPLATE.format(env=env, extras="").replace(
+                "recreate = True\n", ""
+            ),
+            "pyproject.toml": PYPROJECT_TOML_TEMPLATE,
+            "test_file.py": TEST_FILE_TEMPLATE.format(cmp="=="),
+        },
+        base=data_dir / "package_data",
+    )
+    snapshots = tmp_path / "snapshots"
+    project.run("run").assert_success()
+
+    result = project.run("min-req-snapshot", "--export", str(snapshots))
+
+    result.assert_success()
+    assert f"py{env}: exported to" in result.out
+    shutil.rmtree(project.path / ".tox" / f"py{env}")
+
+    result = project.run("min-req-snapshot", "--import", str(snapshots))
+
+    result.assert_success()
+    assert f"py{env}: restored from" in result.out
+    result = project.run("run")
+    result.assert_success()
+    assert "install_package_deps" not in result.out
+
+    (project.path / "pyproject.toml").write_text(
+        PYPROJECT_TOML_TEMPLATE.replace("six>=1.13.0", "six>=1.14.0")
+    )
+    result = project.run("min-req-snapshot", "--import", str(snapshots))
+
+    result.assert_success()
+    assert f"py{env}: no snapshot for the current constraints" in result.out
+
+
+@pytest.mark.parametrize(
+    "files",
+    [
+        {"pyproject.toml": PYPROJECT_TOML_TEMPLATE},
+        {"setup.cfg": SETUP_CFG_TEMPLATE, "setup.py": SETUP_PY_TEMPLATE},
+    ],
+    ids=["pyproject", "setup_cfg"],
+)
+def test_sample(
+    tox_project: ToxProjectCreator,
+    monkeypatch: pytest.MonkeyPatch,
+    data_dir: "Path",
+    tmp_path: "Path",
+    files: "dict[str, str]",
+) -> None:
+    monkeypatch.setenv("MIN_REQ", "1")
+    monkeypatch.setenv("TOX_MIN_REQ_STORE", str(tmp_path / "store.sqlite"))
+    store = MetadataStore(tmp_path / "store.sqlite")
+    for name, versions in {
+        "six": ["1.12.0", "1.13.0", "1.15.0", "1.16.0"],
+        "click": ["7.1.2", "8.0.4", "8.1.7"],
+    }.items():
+        store.add_many([DistributionInfo(name, version) for version in versions])
+    env = f"{sys.version_info[0]}{sys.version_info[1]}"
+    project = tox_project(
+        {
+            "tox.ini": TOX_INI_TEMPLATE.format(env=env, extras="min_req_sample = 4"),
+            **files,
+        },
+        base=data_dir / "package_data",
+    )
+
+    result = project.run("min-req-sample")
+
+    result.assert_success()
+    assert "# 9 assignments (strength 2, seed 0)" in result.out
+    assignments = [x for x in result.out.splitlines() if x[:1].isdigit()]
+    assert len(assignments) == len({x.split(": ")[1] for x in assignments})
+    sampled = assignments[4].split(": ")[1].split()
+
+    result = project.run("min-req-dry-run")
+
+    result.assert_success()
+    for pin in sampled:
+        assert pin in result.out
+    assert "pytest==7.1.0" in result.out
+
+
+@pytest.mark.parametrize(
+    ("mode", "older"),
+    [("oldest", False), ("oldest", True), ("installable", True), ("all", True)],
+)
+def test_min_req_python(
+    tox_project: ToxProjectCreator,
+    monkeypatch: pytest.MonkeyPatch,
+    data_dir: "Path",
+    mode: str,
+    older: bool,
+) -> None:
+    monkeypatch.setenv("MIN_REQ", "1")
+    oldest = (3, sys.version_info[1] - older, 0)
+    monkeypatch.setattr("tox_min_req._tox_plugin.find_oldest_python", lambda *_: oldest)
+    env = f"{sys.version_info[0]}{sys.version_info[1]}"
+    project = tox_project(
+        {
+            "tox.ini": TOX_INI_TEMPLATE.format(
+                env=env, extras=f"min_req_python = {mode}"
+            ),
+            "pyproject.toml": PYPROJECT_TOML_TEMPLATE.replace(
+                'version = "0.0.1"', 'version = "0.0.1"\nrequires-python = ">=3.6"'
+            ),
+        },
+        base=data_dir / "package_data",
+    )
+
+    result = project.run("min-req-dry-run")
+
+    result.assert_success()
+    enabled = mode != "oldest" or not older
+    assert ("six==1.13.0" in result.out) is enabled
+    if not enabled:
+        assert "is the oldest interpreter allowed by requires-python" in result.out
+
+
+def test_min_req_python_not_installable(
+    tox_project: ToxProjectCreator,
+    monkeypatch: pytest.MonkeyPatch,
+    data_dir: "Path",
+    tmp_path: "Path",
+) -> None:
+    monkeypatch.setenv("MIN_REQ", "1")
+    monkeypatch.setenv("TOX_MIN_REQ_STORE", str(tmp_path / "store.sqlite"))
+    MetadataStore(tmp_path / "store.sqlite").add(
+        DistributionInfo("six", "1.13.0", requires_python="<3.6")
+    )
+    monkeypatch.setattr(
+        "tox_min_req._tox_plugin.find_oldest_python", lambda *_: (3, 5, 0)
+    )
+    env = f"{sys.version_info[0]}{sys.version_info[1]}"
+    project = tox_project(
+        {
+            "tox.ini": TOX_INI_TEMPLATE.format(
+                env=env, extras="min_req_python = installable"
+            ),
+            "pyproject.toml": PYPROJECT_TOML_TEMPLATE.replace(
+                'version = "0.0.1"', 'version = "0.0.1"\nrequires-python = ">=3.5"'
+            ),
+            "test_file.py": TEST_FILE_TEMPLATE.format(cmp="!="),
+        },
+        base=data_dir / "package_data",
+    )
+
+    result = project.run("min-req-dry-run")
+
+    result.assert_success()
+    assert "six==1.13.0 (requires Python <3.6)" in result.out
+
+    result = project.run("run")
+
+    result.assert_success()
+    assert "min-req disabled: minimum versions are not installable" in result.out
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from tox_min_req._learned_pins import LearnedPins, learn_from_pip_log, project_key
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+PIP_LOG = """\
+2024-01-01T10:00:01,000 Collecting six==1.13.0
+2024-01-01T10:00:01,500   Installing build dependencies: started
+2024-01-01T10:00:01,500   Running command pip subprocess to install build dependencies
+2024-01-01T10:00:01,600 INFO: pip is looking at multiple versions of setuptools to determine which version is compatible with other requirements.
+2024-01-01T10:00:01,700 Successfully installed setuptools-60.0.0
+2024-01-01T10:00:01,800   Installing build dependencies: finished with status 'done'
+2024-01-01T10:00:02,000 INFO: pip is looking at multiple versions of urllib3 to determine which version is compatible with other requirements.
+2024-01-01T10:00:02,000 INFO: pip is looking at multiple versions of six to determine which version is compatible with other requirements.
+2024-01-01T10:00:03,000 Successfully installed requests-2.20.0 six-1.13.0 urllib3-1.24.3
+2024-01-01T10:00:04,000 ERROR: Cannot install requests==2.20.0 and six==1.13.0 because these package versions have conflicting dependencies.
+2024-01-01T10:00:04,000
+2024-01-01T10:00:04,000 The conflict is caused by:
+2024-01-01T10:00:04,000     The user requested six==1.13.0
+2024-01-01T10:00:04,000     test-package 0.0.1 depends on six>=1.13.0
+2024-01-01T10:00:04,000     python-dateutil 2.9.0 depends on six>=1.15
+2024-01-01T10:00:04,000
+2024-01-01T10:00:04,000 To fix this you could try to:
+"""
+
+
+def test_learn_from_pip_log():
+    assert learn_from_pip_log(
+        PIP_LOG.splitlines(), pinned=["six", "requests"], project="test_package"
+    ) == [
+        "urllib3==1.24.3",
+        "python-dateutil!=2.9.0",
+    ]
+
+
+def test_learned_pins_store(tmp_path: Path):
+    store = LearnedPins(tmp_path / "learned.json")
+    key = project_key({"six": "1.13.0"}, "3.11")
+    assert key != project_key({"six": "1.13.0"}, "3.12")
+    assert store.get(key) == []
+    assert store.add(key, ["urllib3==1.24.3"]) == ["urllib3==1.24.3"]
+    assert store.add(key, ["urllib3==1.24.3", "idna==2.5"]) == ["idna==2.5"]
+    assert LearnedPins(tmp_path / "learned.json").get(key) == [
+        "urllib3==1.24.3",
+        "idna==2.5",
+    ]
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+from tox_min_req._metadata_store import (
+    DistributionInfo,
+    MetadataStore,
+    read_wheel_metadata,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def make_wheel(
+    directory: Path,
+    name: str,
+    version: str,
+    requires: tuple[str, ...] = (),
+    tag: str = "py3-none-any",
+) -> Path:
+    path = directory / f"{name}-{version}-{tag}.whl"
+    metadata = f"Metadata-Version: 2.1\nName: {name}\nVersion: {version}\n"
+    metadata += "Requires-Python: >=3.8\n"
+    metadata += "".join(f"Requires-Dist: {x}\n" for x in requires)
+    with zipfile.ZipFile(path, "w") as wheel:
+        wheel.writestr(f"{name}-{version}.dist-info/METADATA", metadata)
+    return path
+
+
+def test_read_wheel_metadata(tmp_path: Path):
+    path = make_wheel(
+        tmp_path, "Sample_Pkg", "1.2.0", ("six>=1.13",), "py2.py3-none-any"
+    )
+    info = read_wheel_metadata(path)
+    assert info.name == "sample-pkg"
+    assert info.version == "1.2.0"
+    assert info.requires_dist == ("six>=1.13",)
+    assert info.requires_python == ">=3.8"
+    assert info.wheel_tags == ("py2-none-any", "py3-none-any")
+    assert info.upload_time is not None
+
+
+def test_fill_and_get(tmp_path: Path):
+    wheels = tmp_path / "simple" / "six"
+    wheels.mkdir(parents=True)
+    make_wheel(wheels, "six", "1.13.0")
+    make_wheel(wheels, "six", "1.9.0")
+    make_wheel(wheels, "six", "1.13.0", tag="cp311-cp311-manylinux1_x86_64")
+    (wheels / "broken-1.0-py3-none-any.whl").write_text("not a zip")
+
+    store = MetadataStore(tmp_path / "store.sqlite")
+    wheel_count = store.fill_from_directory(tmp_path / "simple")
+    assert wheel_count == len(list(wheels.glob("six-*.whl")))
+    assert [(x.name, x.version) for x in store] == [
+        ("six", "1.13.0"),
+        ("six", "1.9.0"),
+    ]
+    assert store.versions("Six") == ["1.9.0", "1.13.0"]
+    info = store.get("six", "1.13.0")
+    assert info is not None
+    assert set(info.wheel_tags) == {"py3-none-any", "cp311-cp311-manylinux1_x86_64"}
+    assert store.get("six", "2.0.0") is None
+
+
+def test_lru_eviction(tmp_path: Path):
+    store = MetadataStore(tmp_path / "store.sqlite", max_entries=2)
+    store.add(DistributionInfo("a", "1.0"))
+    store.add(DistributionInfo("b", "1.0"))
+    assert store.get("a", "1.0") is not None
+    store.add(DistributionInfo("c", "1.0"))
+    assert len(store) == store.max_entries
+    assert store.get("b", "1.0") is None
+    assert store.get("a", "1.0") is not None
+
+
+def test_lru_versions(tmp_path: Path):
+    store = MetadataStore(tmp_path / "store.sqlite", max_entries=3)
+    store.add_many([DistributionInfo("a", "1.0"), DistributionInfo("a", "2.0")])
+    store.add(DistributionInfo("b", "1.0"))
+    assert store.versions("a") == ["1.0", "2.0"]
+    store.add(DistributionInfo("c", "1.0"))
+    assert store.versions("a") == ["1.0", "2.0"]
+    assert store.get("b", "1.0") is None
+
+
+def test_export_import(tmp_path: Path):
+    store = MetadataStore(tmp_path / "store.sqlite")
+    info = DistributionInfo("a", "1.0", ("b>=2",), ">=3.8", ("py3-none-any",), "x")
+    store.add(info)
+    assert store.export_json(tmp_path / "export.json") == 1
+
+    new_store = MetadataStore(tmp_path / "new" / "store.sqlite")
+    assert new_store.import_json(tmp_path / "export.json") == 1
+    assert new_store.get("a", "1.0") == info
+
+
+def test_concurrent_readers(tmp_path: Path):
+    store = MetadataStore(tmp_path / "store.sqlite")
+    store.add_many([DistributionInfo("a", f"1.{i}") for i in range(20)])
+
+    def read(i: int) -> DistributionInfo | None:
+        return MetadataStore(store.path).get("a", f"1.{i}")
+
+    with ThreadPoolExecutor(4) as executor:
+        assert all(executor.map(read, range(20)))
@@ -3,8 +3,12 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from tox_min_req._parse_dependencies import (
+    parse_build_requires,
+    parse_pyproject_specifiers,
     parse_pyproject_toml,
+    parse_requires_python,
     parse_setup_cfg,
+    parse_setup_cfg_specifiers,
     parse_single_requirement,
 )
 
@@ -112,6 +116,92 @@ def test_pyproject_toml_parse_dependencies_groups(
     }
 
 
+def test_parse_build_requires(tmp_path: Path):
+    pyproject = tmp_path / "pyproject.toml"
+    pyproject.write_text(
+        "[build-system]\n"
+        "requires = [\n"
+        '    "setuptools>=42",\n'
+        '    "wheel",\n'
+        '    "setuptools_scm[toml]>=3.4",\n'
+        "    \"tomli>=1.0 ; python_version < '3.11'\",\n"
+        "]\n"
+    )
+    assert parse_build_requires(pyproject, "3.10", "3.10.1") == {
+        "setuptools": "42",
+        "setuptools_scm": "3.4",
+        "tomli": "1.0",
+    }
+    assert parse_build_requires(pyproject, "3.12", "3.12.1") == {
+        "setuptools": "42",
+        "setuptools_scm": "3.4",
+    }
+    pyproject.write_text("[project]\nname = 'test'\n")
+    assert parse_build_requires(pyproject, "3.12", "3.12.1") == {}
+
+
+def test_parse_pyproject_specifiers(tmp_path: Path):
+    pyproject = tmp_path / "pyproject.toml"
+    pyproject.write_text(
+        "[project]\n"
+        'name = "test"\n'
+        'dependencies = ["six>=1.13.0,!=1.14.0", "Click>=7.1.2", "attrs"]\n'
+        "[project.optional-dependencies]\n"
+        'test = ["click<9", "numpy>=1.22 ; python_version < \'3.10\'"]\n'
+    )
+    assert parse_pyproject_specifiers(pyproject, "3.12", "3.12.1") == {
+        "six": "!=1.14.0,>=1.13.0",
+        "click": ">=7.1.2",
+        "attrs": "",
+    }
+    assert parse_pyproject_specifiers(pyproject, "3.9", "3.9.1", ("test",)) == {
+        "six": "!=1.14.0,>=1.13.0",
+        "click": "<9,>=7.1.2",
+        "attrs": "",
+        "numpy": ">=1.22",
+    }
+
+
+def test_parse_requires_python(tmp_path: Path):
+    pyproject = tmp_path / "pyproject.toml"
+    pyproject.write_text('[project]\nname = "test"\nrequires-python = ">=3.9"\n')
+    assert parse_requires_python(pyproject) == ">=3.9"
+    pyproject.write_text('[project]\nname = "test"\n')
+    assert parse_requires_python(pyproject) is None
+    setup_cfg = tmp_path / "setup.cfg"
+    setup_cfg.write_text("[options]\npython_requires = >=3.8, <4\n")
+    assert parse_requires_python(setup_cfg) == ">=3.8, <4"
+    setup_cfg.write_text("[metadata]\nname = test\n")
+    assert parse_requires_python(setup_cfg) is None
+
+
+def test_parse_setup_cfg_specifiers(tmp_path: Path):
+    setup_cfg = tmp_path / "setup.cfg"
+    setup_cfg.write_text(
+        "[options]\n"
+        "install_requires =\n"
+        "    six>=1.13.0,!=1.14.0\n"
+        "    # comment\n"
+        "    Click>=7.1.2\n"
+        "    attrs\n"
+        "[options.extras_require]\n"
+        "test =\n"
+        "    click<9\n"
+        "    numpy>=1.22 ; python_version < '3.10'\n"
+    )
+    assert parse_setup_cfg_specifiers(setup_cfg, "3.12", "3.12.1") == {
+        "six": "!=1.14.0,>=1.13.0",
+        "click": ">=7.1.2",
+        "attrs": "",
+    }
+    assert parse_setup_cfg_specifiers(setup_cfg, "3.9", "3.9.1", ("test",)) == {
+        "six": "!=1.14.0,>=1.13.0",
+        "click": "<9,>=7.1.2",
+        "attrs": "",
+        "numpy": ">=1.22",
+    }
+
+
 def test_parse_single_requirement():
     p_ver, py_full_ver = "3.10", "3.10.1"
     assert parse_single_requirement("numpy==1.16.0", p_ver, py_full_ver) == {
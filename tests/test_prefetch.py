@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from tox_min_req._prefetch import Prefetch
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pytest
+
+
+class FakePopen:
+    calls: ClassVar[list[list[str]]] = []
+
+    def __init__(self, cmd: list[str], **_kwargs: Any) -> None:
+        self.calls.append(cmd)
+        self.returncode = int(any(x.startswith("scipy") for x in cmd))
+
+    def communicate(self) -> tuple[str, str]:
+        return "", "ERROR: No matching distribution found for scipy==1.2.0\n"
+
+    def poll(self) -> int:
+        return self.returncode
+
+
+def test_prefetch(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(subprocess, "Popen", FakePopen)
+    FakePopen.calls.clear()
+    prefetch = Prefetch(
+        {"six": "1.13.0", "scipy": "1.2.0", "click": "7.1.2"},
+        tmp_path / "wheels",
+        "env/bin/python",
+    )
+    prefetch.start()
+    prefetch.join()
+
+    assert (tmp_path / "wheels").is_dir()
+    assert [x[-1] for x in FakePopen.calls] == [
+        "six==1.13.0",
+        "scipy==1.2.0",
+        "click==7.1.2",
+    ]
+    assert all(x[0] == "env/bin/python" for x in FakePopen.calls)
+    assert prefetch.errors == {
+        "scipy==1.2.0": "ERROR: No matching distribution found for scipy==1.2.0"
+    }
+
+
+def test_prefetch_cancel(tmp_path: Path) -> None:
+    prefetch = Prefetch({"six": "1.13.0"}, tmp_path / "wheels", sys.executable)
+    prefetch.command = lambda name, version: [  # type: ignore[method-assign]
+        sys.executable,
+        "-c",
+        "import time; time.sleep(60)",
+    ]
+    prefetch.start()
+    prefetch.cancel()
+
+    assert not prefetch.is_alive()
+    assert prefetch.errors == {}
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import sys
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from packaging.tags import platform_tags
+from virtualenv.discovery import builtin
+
+from tox_min_req._metadata_store import DistributionInfo, MetadataStore
+from tox_min_req._requires_python import (
+    find_oldest_python,
+    floor_issues,
+    python_candidates,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_python_candidates() -> None:
+    assert python_candidates(">=3.8,<3.11") == ["3.8", "3.9", "3.10"]
+    assert python_candidates("==3.9.*") == ["3.9"]
+    assert python_candidates(">=3.8.1,!=3.10.*")[:3] == ["3.8", "3.9", "3.11"]
+    assert python_candidates("<3") == []
+
+
+def test_find_oldest_python_current() -> None:
+    requires_python = f">={sys.version_info[0]}.{sys.version_info[1]}"
+    assert find_oldest_python(requires_python) == tuple(sys.version_info[:3])
+
+
+def test_find_oldest_python(monkeypatch: pytest.MonkeyPatch) -> None:
+    installed = {"3.9": (3, 9, 0), "3.10": (3, 10, 4), "3.12": (3, 12, 1)}
+    requested: list[str] = []
+
+    def get_interpreter(*args: Any, **kwargs: Any) -> SimpleNamespace | None:
+        key = args[0]
+        requested.append(key)
+        if key not in installed:
+            return None
+        return SimpleNamespace(version_info=(*installed[key], "final", 0))
+
+    monkeypatch.setattr(builtin, "get_interpreter", get_interpreter)
+    find_oldest_python.cache_clear()
+    try:
+        assert find_oldest_python(">=3.8") == (3, 9, 0)
+        assert requested == ["3.8", "3.9"]
+        assert find_oldest_python(">=3.10.5") == (3, 12, 1)
+        assert find_oldest_python(">=3.13") is None
+    finally:
+        find_oldest_python.cache_clear()
+
+
+def test_floor_issues(tmp_path: Path) -> None:
+    platform = next(iter(platform_tags()))
+    store = MetadataStore(tmp_path / "store.sqlite")
+    store.add_many(
+        [
+            DistributionInfo("numpy", "1.21.0", requires_python=">=3.7,<3.11"),
+            DistributionInfo(
+                "numpy", "1.26.0", wheel_tags=("cp312-cp312-manylinux_2_17_x86_64",)
+            ),
+            DistributionInfo("six", "1.13.0", wheel_tags=("py2.py3-none-any",)),
+            DistributionInfo("ext", "1.0", wheel_tags=(f"cp38-cp38-{platform}",)),
+            DistributionInfo("abi3", "1.0", wheel_tags=(f"cp37-abi3-{platform}",)),
+        ]
+    )
+    dependencies = {
+        "numpy": "1.21.0",
+        "six": "1.13.0",
+        "ext": "1.0",
+        "abi3": "1.0",
+        "unknown": "1.0",
+    }
+
+    assert floor_issues(store, dependencies, (3, 8, 10), check_wheel_tags=True) == {}
+    assert floor_issues(store, dependencies, (3, 12, 1)) == {
+        "numpy==1.21.0": "requires Python >=3.7,<3.11",
+    }
+    assert floor_issues(store, dependencies, (3, 12, 1), check_wheel_tags=True) == {
+        "numpy==1.21.0": "requires Python >=3.7,<3.11",
+        "ext==1.0": "no compatible wheel",
+    }
+    assert floor_issues(store, {"six": "1.13.0"}, (3, 12, 1), "PyPy", True) == {}
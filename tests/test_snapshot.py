@@ -0,0 +1,89 @@
+from types import SimpleNamespace
+
+from tox_min_req._snapshot import (
+    export_snapshot,
+    import_snapshot,
+    read_snapshot_metadata,
+    snapshot_key,
+)
+from tox_min_req._tox_plugin import _snapshot_data
+
+
+def test_snapshot_key():
+    data = {"python": ["cpython", [3, 8, 10]], "constraints": [["six", "1.13.0"]]}
+    assert snapshot_key(data) == snapshot_key(dict(reversed(data.items())))
+    assert snapshot_key(data) != snapshot_key({**data, "extras": ["test"]})
+
+
+class _Deps:
+    def lines(self):
+        return []
+
+
+def test_snapshot_data_constraint_files(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    tox_root = tmp_path / "project"
+    tox_root.mkdir()
+    tox_env = SimpleNamespace(
+        core={"tox_root": tox_root, "package_root": tox_root},
+        conf={"extras": [], "dependency_groups": [], "deps": _Deps()},
+        base_python=SimpleNamespace(
+            implementation="CPython",
+            version_info=(3, 8, 10),
+            platform="linux",
+            machine="x86_64",
+            is_64=True,
+        ),
+    )
+    (tmp_path / "extra.txt").write_text("six==1.13.0\n")
+    empty = _snapshot_data(tox_env, {}, ["-c extra.txt"], [])
+    (tox_root / "extra.txt").write_text("six==1.14.0\n")
+    first = _snapshot_data(tox_env, {}, ["-c extra.txt"], [])
+    (tox_root / "extra.txt").write_text("six==1.15.0\n")
+    second = _snapshot_data(tox_env, {}, ["-c extra.txt"], [])
+
+    assert empty["constraint_files"] == [""]
+    assert snapshot_key(first) != snapshot_key(second)
+
+
+def test_export_import(tmp_path):
+    old_root = tmp_path / "old"
+    old_env = old_root / ".tox" / "py"
+    (old_env / "bin").mkdir(parents=True)
+    (old_env / "tmp").mkdir()
+    (old_env / "lib").mkdir()
+    (old_env / "bin" / "pytest").write_text(f"#!{old_env}/bin/python\n")
+    (old_env / "pyvenv.cfg").write_text("home = /usr/bin\n")
+    (old_env / ".tox-info.json").write_text(f'{{"path": "{old_env}/constraints.txt"}}')
+    (old_env / "lib" / "project.pth").write_text(f"{old_root}/src\n")
+    (old_env / "lib" / "__editable___project_0_1_finder.py").write_text(
+        f"MAPPING = {{'project': '{old_root}/src/project'}}\n"
+    )
+    (old_env / "lib" / "binary.so").write_bytes(b"\0" + str(old_env).encode())
+    (old_env / "tmp" / "file.txt").write_text("temporary")
+    archive = tmp_path / "snapshots" / "py.tar.gz"
+    metadata = {"key": "abc", "env_dir": str(old_env), "tox_root": str(old_root)}
+
+    export_snapshot(old_env, archive, metadata)
+
+    assert read_snapshot_metadata(archive) == metadata
+
+    new_root = tmp_path / "new"
+    new_env = new_root / ".tox" / "py"
+    new_env.mkdir(parents=True)
+    (new_env / "stale.txt").write_text("stale")
+
+    import_snapshot(archive, new_env, {"env_dir": new_env, "tox_root": new_root})
+
+    assert (new_env / "bin" / "pytest").read_text() == f"#!{new_env}/bin/python\n"
+    assert (new_env / ".tox-info.json").read_text() == (
+        f'{{"path": "{new_env}/constraints.txt"}}'
+    )
+    assert (new_env / "lib" / "project.pth").read_text() == f"{new_root}/src\n"
+    assert (new_env / "lib" / "__editable___project_0_1_finder.py").read_text() == (
+        f"MAPPING = {{'project': '{new_root}/src/project'}}\n"
+    )
+    assert (new_env / "lib" / "binary.so").read_bytes() == b"\0" + str(old_env).encode()
+    assert (new_env / "pyvenv.cfg").read_text() == "home = /usr/bin\n"
+    assert not (new_env / "tmp").exists()
+    assert not (new_env / "stale.txt").exists()
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import os
+import threading
+from typing import TYPE_CHECKING
+
+import pytest
+
+from tox_min_req._watch import PollingWatcher, create_watcher
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _touch(path: Path, content: str) -> None:
+    path.write_text(content)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_polling_watcher(tmp_path: Path):
+    watched = tmp_path / "pyproject.toml"
+    missing = tmp_path / "requirements.txt"
+    watched.write_text("a")
+    watcher = PollingWatcher([watched, missing])
+
+    assert watcher.poll() == set()
+    _touch(watched, "b")
+    assert watcher.poll() == {watched}
+    assert watcher.poll() == set()
+    missing.write_text("c")
+    assert watcher.wait(timeout=1) == {missing}
+    assert watcher.wait(timeout=0.01) == set()
+
+
+def test_watchdog_watcher(tmp_path: Path):
+    pytest.importorskip("watchdog")
+    watched = tmp_path / "pyproject.toml"
+    other = tmp_path / "other.txt"
+    watched.write_text("a")
+    watcher = create_watcher([watched])
+    try:
+        other.write_text("b")
+        assert watcher.wait(timeout=0.2) == set()
+        timer = threading.Timer(0.05, watched.write_text, ("c",))
+        timer.start()
+        assert watcher.wait(timeout=5) == {watched}
+    finally:
+        watcher.close()
@@ -4,7 +4,9 @@
 """tox plugin for simplify minimal requirements tests by creating minimal constrains file."""
 
 from tox_min_req._parse_dependencies import (
+    parse_build_requires,
     parse_pyproject_toml,
+    parse_requires_python,
     parse_setup_cfg,
     parse_single_requirement,
 )
@@ -12,7 +14,9 @@ from tox_min_req._version import __version__
 
 __all__ = (
     "__version__",
+    "parse_build_requires",
     "parse_pyproject_toml",
+    "parse_requires_python",
     "parse_setup_cfg",
     "parse_single_requirement",
 )
@@ -0,0 +1,158 @@
+"""Module to detect if anything relevant for the min_req environment changed since its last run."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import subprocess
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+__all__ = (
+    "files_hash",
+    "load_state",
+    "save_state",
+    "source_tree_hash",
+)
+
+STATE_FILE_NAME = "min_req_state.json"
+
+_SKIP_DIRS = {"__pycache__", "build", "dist", "node_modules"}
+_SOURCE_SUFFIXES = {
+    ".py",
+    ".pyi",
+    ".pyx",
+    ".pxd",
+    ".c",
+    ".cc",
+    ".cpp",
+    ".h",
+    ".hpp",
+    ".rs",
+    ".toml",
+    ".cfg",
+}
+_METADATA_FILES = {"MANIFEST.in", "setup.py", "requirements.txt"}
+
+
+def _skip_dir(path: Path) -> bool:
+    name = path.name
+    return (
+        name.startswith(".")
+        or name in _SKIP_DIRS
+        or name.endswith(".egg-info")
+        or (path / "pyvenv.cfg").exists()
+    )
+
+
+def _vcs_files(root: Path) -> list[Path] | None:
+    """
+    List files of the git repository in the directory, or None if it is not one.
+
+    Untracked files that are not ignored are included, so a new module
+    changes the hash before it is added to the index. Untracked files in directories
+    skipped outside a repository (like a not ignored ``.tox`` or virtual
+    environment) are left out.
+    """
+    try:
+        output = subprocess.run(
+            [
+                "git",
+                "ls-files",
+                "-z",
+                "-t",
+                "--cached",
+                "--others",
+                "--exclude-standard",
+            ],
+            cwd=root,
+            capture_output=True,
+            check=True,
+        ).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    files = set()
+    for entry in output.decode().split("\0"):
+        if not entry:
+            continue
+        status, name = entry.split(" ", maxsplit=1)
+        if status == "?" and any(
+            _skip_dir(root / x) for x in Path(name).parents if x.name
+        ):
+            continue
+        files.add(root / name)
+    return sorted(files)
+
+
+def _source_files(root: Path) -> list[Path]:
+    """List source and metadata files in the directory tree."""
+    files = []
+    for dir_path, dir_names, file_names in os.walk(root):
+        dir_names[:] = sorted(x for x in dir_names if not _skip_dir(Path(dir_path) / x))
+        for file_name in sorted(file_names):
+            if (
+                Path(file_name).suffix in _SOURCE_SUFFIXES
+                or file_name in _METADATA_FILES
+            ):
+                files.append(Path(dir_path) / file_name)
+    return files
+
+
+def source_tree_hash(root: str | Path) -> str:
+    """
+    Compute hash of the content of the project sources.
+
+    In a git repository, all tracked and not ignored untracked files are hashed
+    (with their content in the working tree). Otherwise, source files and files holding the package
+    metadata are hashed, skipping hidden directories (like ``.tox``), virtual
+    environments, caches and build artifacts. Reports written by commands
+    (like ``coverage.xml``) do not change the hash.
+
+    :param root: root directory of the project
+    :return: hex digest of the tree content
+    """
+    root = Path(root)
+    files = _vcs_files(root)
+    if files is None:
+        files = _source_files(root)
+    digest = hashlib.sha256()
+    for path in files:
+        if not path.is_file():
+            continue
+        digest.update(path.relative_to(root).as_posix().encode())
+        digest.update(b"\0")
+        digest.update(hashlib.sha256(path.read_bytes()).digest())
+    return digest.hexdigest()
+
+
+def files_hash(paths: Iterable[str | Path]) -> str:
+    """
+    Compute hash of the content of the given files. Missing files are hashed as empty.
+
+    :param paths: paths of files
+    :return: hex digest of the files content
+    """
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(str(path).encode())
+        digest.update(b"\0")
+        if Path(path).is_file():
+            digest.update(hashlib.sha256(Path(path).read_bytes()).digest())
+    return digest.hexdigest()
+
+
+def load_state(path: str | Path) -> dict[str, str] | None:
+    """Load the state saved by :func:`save_state`, or None if there is no valid one."""
+    try:
+        return json.loads(Path(path).read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def save_state(path: str | Path, state: dict[str, str]) -> None:
+    """Save the state of the last successful run."""
+    Path(path).write_text(json.dumps(state, indent=2))
@@ -0,0 +1,126 @@
+"""Module to sample versions of dependencies with a t-wise covering array."""
+
+from __future__ import annotations
+
+import random
+from itertools import combinations, product
+from typing import TYPE_CHECKING
+
+from packaging.specifiers import SpecifierSet
+from packaging.version import Version
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    _Tuple = tuple[tuple[str, str], ...]
+
+__all__ = (
+    "covering_array",
+    "representative_versions",
+)
+
+_CANDIDATES = 20
+
+
+def representative_versions(
+    versions: Iterable[str], specifier: str, limit: int = 4
+) -> list[str]:
+    """
+    Select versions allowed by the specifier, that represent the whole range.
+
+    The minimum allowed version and the latest version of every later release
+    series (major.minor) are candidates. If there are more of them than ``limit``,
+    evenly spaced ones are selected, always including the minimum and the latest.
+
+    :param versions: known versions of the distribution
+    :param specifier: version specifier of the dependency
+    :param limit: maximum number of selected versions
+    :return: selected versions sorted from the oldest
+    """
+    allowed = sorted(SpecifierSet(specifier).filter(Version(x) for x in versions))
+    if not allowed:
+        return []
+    series: dict[tuple[int, ...], Version] = {}
+    for version in allowed[1:]:
+        series[version.release[:2]] = version
+    candidates = [allowed[0]] + [
+        x for x in series.values() if x.release[:2] != allowed[0].release[:2]
+    ]
+    if len(candidates) > limit > 1:
+        step = (len(candidates) - 1) / (limit - 1)
+        candidates = [candidates[round(i * step)] for i in range(limit)]
+    return [str(x) for x in candidates[:limit]]
+
+
+def _tuples(row: dict[str, str], strength: int) -> set[_Tuple]:
+    return {
+        tuple((name, row[name]) for name in names)
+        for names in combinations(sorted(row), strength)
+    }
+
+
+def _build_row(
+    parameters: dict[str, list[str]],
+    uncovered: set[_Tuple],
+    start: _Tuple,
+    strength: int,
+    rng: random.Random,
+) -> dict[str, str]:
+    row = dict(start)
+    rest = [x for x in parameters if x not in row]
+    rng.shuffle(rest)
+    for name in rest:
+        best_value, best_gain = parameters[name][0], -1
+        for value in parameters[name]:
+            gain = sum(
+                tuple(sorted([*((x, row[x]) for x in names), (name, value)]))
+                in uncovered
+                for names in combinations(sorted(row), strength - 1)
+            )
+            if gain > best_gain:
+                best_value, best_gain = value, gain
+        row[name] = best_value
+    return {name: row[name] for name in parameters}
+
+
+def covering_array(
+    parameters: dict[str, list[str]], strength: int = 2, seed: int = 0
+) -> list[dict[str, str]]:
+    """
+    Generate a small set of assignments covering all t-wise value combinations.
+
+    For every ``strength`` parameters, each combination of their values is
+    used by at least one assignment. Assignments are created greedily, similarly
+    to the AETG algorithm: from several random candidates, the one covering most
+    of the still uncovered combinations is chosen. The result depends only
+    on the parameters, the strength and the seed.
+
+    :param parameters: mapping of the parameter name to its possible values
+    :param strength: number of parameters whose combinations are covered
+    :param seed: seed of the random generator
+    :return: list of assignments, mapping parameter names to values
+    """
+    parameters = {k: list(v) for k, v in sorted(parameters.items()) if v}
+    if not parameters:
+        return []
+    strength = max(1, min(strength, len(parameters)))
+    rng = random.Random(seed)
+    uncovered = {
+        tuple(zip(names, values))
+        for names in combinations(parameters, strength)
+        for values in product(*(parameters[x] for x in names))
+    }
+    rows = []
+    while uncovered:
+        ordered = sorted(uncovered)
+        best_row: dict[str, str] = {}
+        best_covered: set[_Tuple] = set()
+        for _ in range(_CANDIDATES):
+            start = rng.choice(ordered)
+            row = _build_row(parameters, uncovered, start, strength, rng)
+            covered = _tuples(row, strength) & uncovered
+            if len(covered) > len(best_covered):
+                best_row, best_covered = row, covered
+        rows.append(best_row)
+        uncovered -= best_covered
+    return rows
@@ -0,0 +1,77 @@
+"""Module to find the minimal failure inducing subset of pins by delta debugging."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+__all__ = ("ddmin",)
+
+T = TypeVar("T")
+
+_MIN_GRANULARITY = 2
+
+
+def _split(items: list[T], n: int) -> list[list[T]]:
+    """Split items into n chunks of almost equal length."""
+    size, rest = divmod(len(items), n)
+    chunks = []
+    start = 0
+    for i in range(n):
+        end = start + size + (i < rest)
+        chunks.append(items[start:end])
+        start = end
+    return chunks
+
+
+def ddmin(
+    items: Sequence[T], test: Callable[[list[T]], bool], jobs: int = 1
+) -> list[T]:
+    """
+    Reduce the items to a 1-minimal subset for which the test still fails.
+
+    It is the ddmin algorithm of Zeller and Hildebrandt. All subsets and
+    complements of a single granularity level are tested in parallel, and the first
+    failing one (in order) is chosen, so the result does not depend on ``jobs``.
+    Test results are cached, so no subset is tested twice.
+
+    :param items: items for which the test fails
+    :param test: function returning True if the failure reproduces for the subset
+    :param jobs: number of tests run in parallel
+    :return: subset of items for which the test fails, but passes after removal
+        of any single item
+    """
+    cache: dict[tuple[int, ...], bool] = {}
+    current = list(range(len(items)))
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+
+        def run(candidates: list[list[int]]) -> list[bool]:
+            todo = list(
+                dict.fromkeys(tuple(x) for x in candidates if tuple(x) not in cache)
+            )
+            results = executor.map(lambda x: test([items[i] for i in x]), todo)
+            cache.update(zip(todo, results))
+            return [cache[tuple(x)] for x in candidates]
+
+        n = _MIN_GRANULARITY
+        while len(current) >= _MIN_GRANULARITY:
+            chunks = _split(current, n)
+            complements = [[x for x in current if x not in chunk] for chunk in chunks]
+            candidates = chunks + (complements if n > _MIN_GRANULARITY else [])
+            results = run(candidates)
+            failing = next((i for i, r in enumerate(results) if r), None)
+            if failing is not None:
+                current = candidates[failing]
+                if failing < len(chunks):
+                    n = _MIN_GRANULARITY
+                else:
+                    n = max(n - 1, _MIN_GRANULARITY)
+                continue
+            if n >= len(current):
+                break
+            n = min(len(current), n * 2)
+    return [items[i] for i in current]
@@ -0,0 +1,128 @@
+"""Module to trace which distributions are imported by commands of the min_req environment."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from packaging.utils import canonicalize_name
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+__all__ = (
+    "imported_distributions",
+    "install_tracer",
+    "read_traced_modules",
+    "unused_dependencies",
+)
+
+IMPORTS_FILE_NAME = "min_req_imports.json"
+TRACE_DIR_NAME = "min_req_import_trace"
+TRACE_DIR_ENV = "TOX_MIN_REQ_TRACE_DIR"
+
+_TRACER_MODULE = "_tox_min_req_trace"
+
+_TRACER_SOURCE = f"""
+import atexit
+import os
+import sys
+
+
+def _dump():
+    names = sorted({{name.partition(".")[0] for name in list(sys.modules)}})
+    path = os.path.join(os.environ["{TRACE_DIR_ENV}"], f"{{os.getpid()}}.txt")
+    with open(path, "w") as f:
+        f.write("\\n".join(names))
+
+
+if os.environ.get("{TRACE_DIR_ENV}"):
+    atexit.register(_dump)
+"""
+
+_DISTRIBUTIONS_SCRIPT = """
+import json
+from importlib.metadata import distributions
+
+result = {}
+for dist in distributions():
+    top_level = dist.read_text("top_level.txt")
+    if top_level:
+        names = top_level.split()
+    else:
+        names = []
+        for file in dist.files or []:
+            first = file.parts[0]
+            if first.endswith((".dist-info", ".egg-info", ".pth", ".data")):
+                continue
+            if first == "__pycache__" or first == "..":
+                continue
+            names.append(first[:-3] if first.endswith(".py") else first)
+    for name in set(names):
+        result.setdefault(name, []).append(dist.metadata["Name"])
+print(json.dumps(result))
+"""
+
+
+def install_tracer(site_packages: str | Path) -> None:
+    """
+    Install the import tracer to the site-packages directory of the environment.
+
+    A ``.pth`` file imports the tracer module at the interpreter startup.
+    The tracer does nothing, unless the trace directory is set
+    in the ``TOX_MIN_REQ_TRACE_DIR`` environment variable. Then, at exit, it dumps
+    the top level names of all imported modules to a file in this directory.
+
+    :param site_packages: site-packages directory of the environment
+    """
+    site_packages = Path(site_packages)
+    (site_packages / f"{_TRACER_MODULE}.py").write_text(_TRACER_SOURCE)
+    (site_packages / f"{_TRACER_MODULE}.pth").write_text(f"import {_TRACER_MODULE}\n")
+
+
+def read_traced_modules(trace_dir: str | Path) -> set[str]:
+    """Read top level names of modules imported by all traced processes."""
+    modules: set[str] = set()
+    for path in Path(trace_dir).glob("*.txt"):
+        modules.update(x for x in path.read_text().split() if x)
+    modules.discard(_TRACER_MODULE)
+    return modules
+
+
+def imported_distributions(python: str | Path, modules: Iterable[str]) -> set[str]:
+    """
+    Map imported modules to distributions installed in the environment.
+
+    :param python: python executable of the environment
+    :param modules: top level names of imported modules
+    :return: canonical names of distributions providing the modules
+    """
+    output = subprocess.run(
+        [str(python), "-c", _DISTRIBUTIONS_SCRIPT],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    mapping: dict[str, list[str]] = json.loads(output)
+    return {
+        canonicalize_name(dist)
+        for module in modules
+        for dist in mapping.get(module, [])
+    }
+
+
+def unused_dependencies(reports: Iterable[dict[str, list[str]]]) -> list[str]:
+    """
+    Find dependencies that are not imported in any environment which declares them.
+
+    :param reports: content of the imports files of environments
+    :return: sorted canonical names of the never imported dependencies
+    """
+    declared: set[str] = set()
+    imported: set[str] = set()
+    for report in reports:
+        declared.update(report["declared"])
+        imported.update(report["imported"])
+    return sorted(declared - imported)
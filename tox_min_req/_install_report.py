@@ -0,0 +1,186 @@
+"""Module to attribute the install time of an environment to the installed packages."""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from packaging.requirements import InvalidRequirement, Requirement
+from packaging.utils import canonicalize_name
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+__all__ = (
+    "InstallReport",
+    "PackageCost",
+    "parse_pip_log",
+    "pip_log_messages",
+)
+
+PIP_LOG_FILE_NAME = "min_req_pip.log"
+REPORT_FILE_NAME = "min_req_install_report.json"
+
+_LOG_LINE = re.compile(r"^(\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d,\d+) (\s*)(.*)$")
+_STEP = re.compile(
+    r"^(Installing build dependencies|Getting requirements to build \w+"
+    r"|Preparing metadata \(.+\)|Building wheel for (\S+) \(.+\)): (started|finished)"
+)
+_SUBPROCESS_INDENT = "  "
+
+
+@dataclass
+class PackageCost:
+    """Time in seconds spent on a single package during the install phase."""
+
+    name: str
+    download: float = 0.0
+    build: float = 0.0
+
+    @property
+    def total(self) -> float:
+        """Total time spent on the package."""
+        return self.download + self.build
+
+
+@dataclass
+class InstallReport:
+    """
+    Install phase cost of an environment.
+
+    ``install`` is the time of the final installation step, which pip does not
+    report per package.
+    """
+
+    packages: dict[str, PackageCost] = field(default_factory=dict)
+    install: float = 0.0
+
+    def package(self, name: str) -> PackageCost:
+        """Get the cost entry of the package, creating it if needed."""
+        if name not in self.packages:
+            self.packages[name] = PackageCost(name)
+        return self.packages[name]
+
+    def ranked(self) -> list[PackageCost]:
+        """Return packages sorted from the most expensive."""
+        return sorted(self.packages.values(), key=lambda x: x.total, reverse=True)
+
+    def to_json(self) -> dict[str, object]:
+        """Convert to a JSON serializable dict."""
+        return {
+            "packages": [
+                {"name": x.name, "download": x.download, "build": x.build}
+                for x in self.ranked()
+            ],
+            "install": self.install,
+        }
+
+    def format(self, limit: int = 10) -> str:
+        """
+        Format the ranking of the most expensive packages.
+
+        :param limit: maximum number of listed packages
+        """
+        lines = [f"{'package':<30} {'download':>9} {'build':>9}"]
+        lines.extend(
+            f"{x.name:<30} {x.download:>8.1f}s {x.build:>8.1f}s"
+            for x in self.ranked()[:limit]
+        )
+        lines.append(f"{'(install step)':<30} {self.install:>19.1f}s")
+        return "\n".join(lines)
+
+
+def _package_name(text: str) -> str:
+    text = text.split(" (from ", maxsplit=1)[0].strip()
+    try:
+        return canonicalize_name(Requirement(text).name)
+    except InvalidRequirement:
+        return text.rstrip("/").rsplit("/", maxsplit=1)[-1]
+
+
+def pip_log_messages(lines: Iterable[str]) -> Iterator[tuple[datetime, str]]:
+    """
+    Iterate over messages of the log written by pip ``--log`` (or ``PIP_LOG``) option.
+
+    The log of pip subprocesses installing build dependencies is written
+    to the same file, so it is skipped.
+
+    :param lines: lines of the log file
+    :return: iterator over the time and the message with stripped indentation
+    """
+    depth = 0
+    for line in lines:
+        match = _LOG_LINE.match(line.rstrip("\n"))
+        if match is None:
+            continue
+        indent, message = match.group(2), match.group(3)
+        if indent == _SUBPROCESS_INDENT and message.startswith(
+            "Running command pip subprocess"
+        ):
+            depth += 1
+            continue
+        if indent == _SUBPROCESS_INDENT and message.startswith(
+            "Installing build dependencies: finished"
+        ):
+            depth = max(depth - 1, 0)
+        if depth == 0:
+            yield datetime.strptime(match.group(1), "%Y-%m-%dT%H:%M:%S,%f"), message
+
+
+class _PipLogParser:
+    def __init__(self) -> None:
+        self.report = InstallReport()
+        self.current = ""
+        self.started: dict[tuple[str, str], datetime] = {}
+        self.download: tuple[str, datetime] | None = None
+
+    def feed(self, time: datetime, message: str) -> None:
+        if self.download is not None:
+            name, download_start = self.download
+            self.report.package(name).download += (
+                time - download_start
+            ).total_seconds()
+            self.download = None
+
+        step = _STEP.match(message)
+        if message.startswith(("Collecting ", "Processing ")):
+            self.current = _package_name(message.split(" ", maxsplit=1)[1])
+        elif message.startswith("Downloading "):
+            self.download = (self.current, time)
+        elif message.startswith("Installing collected packages"):
+            self.started["", "install"] = time
+        elif message.startswith("Successfully installed"):
+            self._finish("", "install", time)
+        elif step is not None:
+            name = canonicalize_name(step.group(2)) if step.group(2) else self.current
+            if step.group(3) == "started":
+                self.started[name, step.group(1)] = time
+            else:
+                self._finish(name, step.group(1), time)
+
+    def _finish(self, name: str, step: str, time: datetime) -> None:
+        if (name, step) not in self.started:
+            return
+        duration = (time - self.started.pop((name, step))).total_seconds()
+        if name:
+            self.report.package(name).build += duration
+        else:
+            self.report.install += duration
+
+
+def parse_pip_log(lines: Iterable[str]) -> InstallReport:
+    """
+    Parse the log written by pip ``--log`` (or ``PIP_LOG``) option.
+
+    The whole installation of build dependencies is attributed
+    to the package being built.
+
+    :param lines: lines of the log file
+    :return: install cost attributed to packages
+    """
+    parser = _PipLogParser()
+    for time, message in pip_log_messages(lines):
+        parser.feed(time, message)
+    return parser.report
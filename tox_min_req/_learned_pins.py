@@ -0,0 +1,139 @@
+"""Module to learn indirect pins from the resolver backtracking and conflicts reported by pip."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from packaging.utils import canonicalize_name
+
+from ._install_report import pip_log_messages
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+__all__ = (
+    "LearnedPins",
+    "learn_from_pip_log",
+    "project_key",
+)
+
+LEARNED_PINS_FILE_NAME = "min_req_learned_pins.json"
+
+_BACKTRACKING = re.compile(r"pip is looking at multiple versions of (\S+) to determine")
+_DEPENDS_ON = re.compile(r"^(\S+) (\S+) depends on ")
+
+
+def learn_from_pip_log(
+    lines: Iterable[str], pinned: Iterable[str] = (), project: str | None = None
+) -> list[str]:
+    """
+    Derive constraints that would avoid the backtracking and conflicts from the pip log.
+
+    For a package the resolver backtracked on, the finally installed version is pinned.
+    For a package version causing an unresolvable conflict, the version is excluded.
+    Packages that are already pinned and the project itself (the root of the resolve,
+    which is listed in conflicts with its own requirements) are skipped.
+
+    :param lines: lines of the log file
+    :param pinned: names of already pinned packages
+    :param project: name of the project under test
+    :return: list of learned constraints
+    """
+    skip: set[str] = {canonicalize_name(x) for x in pinned}
+    if project is not None:
+        skip.add(canonicalize_name(project))
+    backtracked: set[str] = set()
+    installed: dict[str, str] = {}
+    excluded: dict[str, str] = {}
+    in_conflict = False
+    for _, message in pip_log_messages(lines):
+        backtracking = _BACKTRACKING.search(message)
+        depends_on = _DEPENDS_ON.match(message)
+        if backtracking is not None:
+            backtracked.add(canonicalize_name(backtracking.group(1)))
+        elif message.startswith("Successfully installed "):
+            for item in message.split()[2:]:
+                name, version = item.rsplit("-", maxsplit=1)
+                installed[canonicalize_name(name)] = version
+        elif message.startswith("The conflict is caused by:"):
+            in_conflict = True
+        elif in_conflict and depends_on is not None:
+            excluded[canonicalize_name(depends_on.group(1))] = depends_on.group(2)
+        elif not message.startswith("The user requested"):
+            in_conflict = False
+
+    return _learned_constraints(backtracked, installed, excluded, skip)
+
+
+def _learned_constraints(
+    backtracked: set[str],
+    installed: dict[str, str],
+    excluded: dict[str, str],
+    skip: set[str],
+) -> list[str]:
+    learned = {
+        name: f"{name}=={installed[name]}"
+        for name in sorted(backtracked)
+        if name in installed and name not in skip
+    }
+    for name, version in sorted(excluded.items()):
+        if name not in skip and name not in learned:
+            learned[name] = f"{name}!={version}"
+    return list(learned.values())
+
+
+def project_key(dependencies: dict[str, str], python_version: str) -> str:
+    """
+    Compute the key under which pins learned for the project are stored.
+
+    :param dependencies: minimum requirements computed for the project
+    :param python_version: major.minor version of python
+    """
+    data = json.dumps([sorted(dependencies.items()), python_version])
+    return hashlib.sha256(data.encode()).hexdigest()
+
+
+class LearnedPins:
+    """
+    JSON file with constraints learned for the (project, interpreter) keys.
+
+    :param path: path to the JSON file
+    """
+
+    _lock = threading.Lock()
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+
+    def _load(self) -> dict[str, list[str]]:
+        try:
+            return json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return {}
+
+    def get(self, key: str) -> list[str]:
+        """Get the constraints learned for the key."""
+        with self._lock:
+            return self._load().get(key, [])
+
+    def add(self, key: str, constraints: list[str]) -> list[str]:
+        """
+        Add constraints learned for the key.
+
+        :param key: key of the project and interpreter
+        :param constraints: learned constraints
+        :return: constraints that were not known before
+        """
+        with self._lock:
+            data = self._load()
+            known = data.setdefault(key, [])
+            new = [x for x in constraints if x not in known]
+            if new:
+                known.extend(new)
+                self.path.write_text(json.dumps(data, indent=2))
+        return new
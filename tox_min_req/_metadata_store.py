@@ -0,0 +1,298 @@
+"""Persistent store of package metadata used to reason about versions without an index."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import time
+import zipfile
+from contextlib import closing
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.parser import HeaderParser
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from packaging.utils import canonicalize_name
+from packaging.version import InvalidVersion, Version
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+__all__ = (
+    "DistributionInfo",
+    "MetadataStore",
+    "read_wheel_metadata",
+)
+
+STORE_FILE_NAME = "min_req_metadata.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS distributions (
+    name TEXT NOT NULL,
+    version TEXT NOT NULL,
+    requires_dist TEXT NOT NULL,
+    requires_python TEXT,
+    wheel_tags TEXT NOT NULL,
+    upload_time TEXT,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (name, version)
+)
+"""
+
+
+@dataclass(frozen=True)
+class DistributionInfo:
+    """Metadata of a single released version of a distribution."""
+
+    name: str
+    version: str
+    requires_dist: tuple[str, ...] = ()
+    requires_python: str | None = None
+    wheel_tags: tuple[str, ...] = ()
+    upload_time: str | None = None
+
+    def to_json(self) -> dict[str, object]:
+        """Convert to a JSON serializable dict."""
+        return {
+            "name": self.name,
+            "version": self.version,
+            "requires_dist": list(self.requires_dist),
+            "requires_python": self.requires_python,
+            "wheel_tags": list(self.wheel_tags),
+            "upload_time": self.upload_time,
+        }
+
+    @classmethod
+    def from_json(cls, data: dict[str, object]) -> DistributionInfo:
+        """Create from the dict produced by :meth:`to_json`."""
+        return cls(
+            name=str(data["name"]),
+            version=str(data["version"]),
+            requires_dist=tuple(data.get("requires_dist") or ()),  # type: ignore[arg-type]
+            requires_python=data.get("requires_python"),  # type: ignore[arg-type]
+            wheel_tags=tuple(data.get("wheel_tags") or ()),  # type: ignore[arg-type]
+            upload_time=data.get("upload_time"),  # type: ignore[arg-type]
+        )
+
+
+def _wheel_tags(file_name: str) -> tuple[str, ...]:
+    parts = file_name[: -len(".whl")].split("-")
+    python_tags, abi_tags, platform_tags = parts[-3:]
+    return tuple(
+        f"{py}-{abi}-{plat}"
+        for py in python_tags.split(".")
+        for abi in abi_tags.split(".")
+        for plat in platform_tags.split(".")
+    )
+
+
+def read_wheel_metadata(path: str | Path) -> DistributionInfo:
+    """
+    Read metadata of a wheel file.
+
+    The modification time of the file is used as the upload time,
+    as local files do not carry the upload time of the index.
+
+    :param path: path to the wheel file
+    :return: metadata of the wheel
+    """
+    path = Path(path)
+    with zipfile.ZipFile(path) as wheel:
+        metadata_name = next(
+            x
+            for x in wheel.namelist()
+            if x.count("/") == 1 and x.endswith(".dist-info/METADATA")
+        )
+        metadata = HeaderParser().parsestr(wheel.read(metadata_name).decode("utf-8"))
+    upload_time = datetime.fromtimestamp(path.stat().st_mtime, tz=timezone.utc)
+    return DistributionInfo(
+        name=canonicalize_name(metadata["Name"]),
+        version=metadata["Version"],
+        requires_dist=tuple(metadata.get_all("Requires-Dist") or ()),
+        requires_python=metadata.get("Requires-Python"),
+        wheel_tags=_wheel_tags(path.name),
+        upload_time=upload_time.isoformat(),
+    )
+
+
+class MetadataStore:
+    """
+    SQLite backed store of (name, version) to distribution metadata.
+
+    The database works in WAL mode, so it could be read by parallel tox environments.
+    When the number of entries exceeds ``max_entries``, the least recently used
+    entries are evicted.
+
+    :param path: path to the database file
+    :param max_entries: maximum number of stored (name, version) entries
+    """
+
+    def __init__(self, path: str | Path, max_entries: int = 10_000) -> None:
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30)
+
+    def add(self, info: DistributionInfo) -> None:
+        """
+        Add or update metadata of a distribution version.
+
+        Wheel tags of an already stored version are merged with the new ones.
+
+        :param info: metadata to store
+        """
+        self.add_many([info])
+
+    def add_many(self, infos: list[DistributionInfo]) -> None:
+        """Add or update metadata of multiple distribution versions."""
+        now = time.time()
+        with closing(self._connect()) as conn, conn:
+            for info in infos:
+                name = canonicalize_name(info.name)
+                row = conn.execute(
+                    "SELECT wheel_tags FROM distributions WHERE name=? AND version=?",
+                    (name, info.version),
+                ).fetchone()
+                tags = set(info.wheel_tags)
+                if row is not None:
+                    tags.update(json.loads(row[0]))
+                conn.execute(
+                    "INSERT OR REPLACE INTO distributions VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        name,
+                        info.version,
+                        json.dumps(list(info.requires_dist)),
+                        info.requires_python,
+                        json.dumps(sorted(tags)),
+                        info.upload_time,
+                        now,
+                    ),
+                )
+            self._evict(conn)
+
+    def fill_from_directory(self, path: str | Path) -> int:
+        """
+        Add all wheel files found in the directory tree.
+
+        Works with a wheelhouse, the pip wheel cache or a static simple index directory.
+
+        :param path: directory to scan
+        :return: number of processed wheel files
+        """
+        infos = []
+        for wheel_path in sorted(Path(path).rglob("*.whl")):
+            try:
+                infos.append(read_wheel_metadata(wheel_path))
+            except (zipfile.BadZipFile, StopIteration, KeyError):
+                continue
+        self.add_many(infos)
+        return len(infos)
+
+    def get(self, name: str, version: str) -> DistributionInfo | None:
+        """
+        Get metadata of a distribution version and mark it as recently used.
+
+        :param name: name of the distribution
+        :param version: version of the distribution
+        :return: stored metadata or None if the version is unknown
+        """
+        name = canonicalize_name(name)
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT name, version, requires_dist, requires_python, wheel_tags, "
+                "upload_time FROM distributions WHERE name=? AND version=?",
+                (name, version),
+            ).fetchone()
+            if row is None:
+                return None
+            self._touch(conn, "name=? AND version=?", (name, version))
+        return self._from_row(row)
+
+    def versions(self, name: str) -> list[str]:
+        """
+        Get all known versions of the distribution and mark them as recently used.
+
+        :param name: name of the distribution
+        :return: list of valid versions sorted from the oldest
+        """
+        name = canonicalize_name(name)
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT version FROM distributions WHERE name=?", (name,)
+            ).fetchall()
+            if rows:
+                self._touch(conn, "name=?", (name,))
+        versions = []
+        for (version,) in rows:
+            try:
+                versions.append(Version(version))
+            except InvalidVersion:
+                continue
+        return [str(x) for x in sorted(versions)]
+
+    def __iter__(self) -> Iterator[DistributionInfo]:
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT name, version, requires_dist, requires_python, wheel_tags, "
+                "upload_time FROM distributions ORDER BY name, version"
+            ).fetchall()
+        return (self._from_row(row) for row in rows)
+
+    def __len__(self) -> int:
+        with closing(self._connect()) as conn:
+            return conn.execute("SELECT COUNT(*) FROM distributions").fetchone()[0]
+
+    def export_json(self, path: str | Path) -> int:
+        """
+        Export the whole store to a JSON file, e.g. to save it in CI cache.
+
+        :param path: path of the JSON file
+        :return: number of exported entries
+        """
+        data = [x.to_json() for x in self]
+        Path(path).write_text(json.dumps(data, indent=1))
+        return len(data)
+
+    def import_json(self, path: str | Path) -> int:
+        """
+        Import entries exported by :meth:`export_json`.
+
+        :param path: path of the JSON file
+        :return: number of imported entries
+        """
+        data = json.loads(Path(path).read_text())
+        self.add_many([DistributionInfo.from_json(x) for x in data])
+        return len(data)
+
+    @staticmethod
+    def _touch(conn: sqlite3.Connection, where: str, params: tuple[str, ...]) -> None:
+        """Update the last use time of all matching entries in a single statement."""
+        with conn:
+            conn.execute(
+                f"UPDATE distributions SET last_used=? WHERE {where}",
+                (time.time(), *params),
+            )
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        conn.execute(
+            "DELETE FROM distributions WHERE rowid IN ("
+            "SELECT rowid FROM distributions ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,),
+        )
+
+    @staticmethod
+    def _from_row(row: tuple) -> DistributionInfo:
+        return DistributionInfo(
+            name=row[0],
+            version=row[1],
+            requires_dist=tuple(json.loads(row[2])),
+            requires_python=row[3],
+            wheel_tags=tuple(json.loads(row[4])),
+            upload_time=row[5],
+        )
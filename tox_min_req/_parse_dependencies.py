@@ -9,8 +9,11 @@ import warnings
 from collections.abc import Sequence
 from configparser import ConfigParser
 from pathlib import Path
+from typing import Any
 
 from packaging.requirements import Requirement
+from packaging.specifiers import SpecifierSet
+from packaging.utils import canonicalize_name
 
 if sys.version_info < (3, 11):
     from tomli import loads as toml_loads
@@ -20,8 +23,13 @@ else:
 version_constrains = re.compile(r"([a-zA-Z0-9_\-]+)([><=!]+)([0-9\.]+)")
 
 __all__ = (
+    "parse_build_requires",
+    "parse_project_name",
+    "parse_pyproject_specifiers",
     "parse_pyproject_toml",
+    "parse_requires_python",
     "parse_setup_cfg",
+    "parse_setup_cfg_specifiers",
     "parse_single_requirement",
 )
 
@@ -197,30 +205,17 @@ def get_all_dependency_groups_to_visit(
     return visited_dependency_groups, required_extras
 
 
-def parse_pyproject_toml(
-    path: str | Path,
-    python_version: str,
-    python_full_version: str,
+def _pyproject_requirement_lines(
+    data: dict[str, Any],
     extras: Sequence[str] = (),
     dependency_groups: Sequence[str] = (),
-) -> dict[str, str]:
+) -> list[str]:
     """
-    Parse the pyproject.toml file and return a dict of the dependencies and their lower version constraints.
+    Collect requirement lines of the project, selected extras and dependency groups.
 
-    :param path: path to pyproject.toml file
-    :param python_version: major.minor version of python
-    :param python_full_version: major.minor.patch version of python
-    :param extras: list of extras to include
-    :param dependency_groups: list of dependency groups to include
-    :return: dict of the dependencies that fit to environment and their lower version constraints
+    ``include-group`` tables are skipped, as included groups are visited directly.
     """
-    with Path(path).open() as f:
-        data = toml_loads(f.read())
-    base_constrains: dict[str, str] = {}
-    for line in data["project"]["dependencies"]:
-        base_constrains.update(
-            parse_single_requirement(line, python_version, python_full_version)
-        )
+    lines = list(data["project"]["dependencies"])
     project_name = data["project"]["name"]
     if extras:
         extras_to_visit = get_all_extras_to_visit(
@@ -244,13 +239,171 @@ def parse_pyproject_toml(
         additional_extras = set()
 
     for extra in extras_to_visit | additional_extras:
-        for line in data["project"]["optional-dependencies"][extra]:
-            base_constrains.update(
-                parse_single_requirement(line, python_version, python_full_version)
-            )
+        lines.extend(data["project"]["optional-dependencies"][extra])
     for group in dependency_groups_to_visit:
-        for line in data["dependency-groups"][group]:
-            base_constrains.update(
-                parse_single_requirement(line, python_version, python_full_version)
-            )
+        lines.extend(x for x in data["dependency-groups"][group] if isinstance(x, str))
+    return lines
+
+
+def parse_pyproject_toml(
+    path: str | Path,
+    python_version: str,
+    python_full_version: str,
+    extras: Sequence[str] = (),
+    dependency_groups: Sequence[str] = (),
+) -> dict[str, str]:
+    """
+    Parse the pyproject.toml file and return a dict of the dependencies and their lower version constraints.
+
+    :param path: path to pyproject.toml file
+    :param python_version: major.minor version of python
+    :param python_full_version: major.minor.patch version of python
+    :param extras: list of extras to include
+    :param dependency_groups: list of dependency groups to include
+    :return: dict of the dependencies that fit to environment and their lower version constraints
+    """
+    with Path(path).open() as f:
+        data = toml_loads(f.read())
+    base_constrains: dict[str, str] = {}
+    for line in _pyproject_requirement_lines(data, extras, dependency_groups):
+        base_constrains.update(
+            parse_single_requirement(line, python_version, python_full_version)
+        )
     return base_constrains
+
+
+def parse_pyproject_specifiers(
+    path: str | Path,
+    python_version: str,
+    python_full_version: str,
+    extras: Sequence[str] = (),
+    dependency_groups: Sequence[str] = (),
+) -> dict[str, str]:
+    """
+    Parse the pyproject.toml file and return a dict of the dependencies and their full version specifiers.
+
+    Specifiers of a dependency listed multiple times are combined.
+
+    :param path: path to pyproject.toml file
+    :param python_version: major.minor version of python
+    :param python_full_version: major.minor.patch version of python
+    :param extras: list of extras to include
+    :param dependency_groups: list of dependency groups to include
+    :return: dict of the dependencies that fit to environment and their version specifiers
+    """
+    with Path(path).open() as f:
+        data = toml_loads(f.read())
+    return _combine_specifiers(
+        _pyproject_requirement_lines(data, extras, dependency_groups),
+        python_version,
+        python_full_version,
+    )
+
+
+def parse_setup_cfg_specifiers(
+    path: str | Path,
+    python_version: str,
+    python_full_version: str,
+    extras: Sequence[str] = (),
+) -> dict[str, str]:
+    """
+    Parse the setup.cfg file and return a dict of the dependencies and their full version specifiers.
+
+    Specifiers of a dependency listed multiple times are combined.
+
+    :param path: path to setup.cfg file
+    :param python_version: major.minor version of python
+    :param python_full_version: major.minor.patch version of python
+    :param extras: list of extras to include
+    :return: dict of the dependencies that fit to environment and their version specifiers
+    """
+    config = ConfigParser()
+    config.read(path)
+    sections = [config["options"].get("install_requires", "")]
+    if config.has_section("options.extras_require"):
+        sections.extend(
+            value
+            for extra, value in config["options.extras_require"].items()
+            if extra in extras
+        )
+    lines = [
+        x.strip()
+        for section in sections
+        for x in section.splitlines()
+        if x.strip() and not x.strip().startswith("#")
+    ]
+    return _combine_specifiers(lines, python_version, python_full_version)
+
+
+def _combine_specifiers(
+    lines: Sequence[str], python_version: str, python_full_version: str
+) -> dict[str, str]:
+    specifiers: dict[str, SpecifierSet] = {}
+    for line in lines:
+        req = Requirement(line.split("#", maxsplit=1)[0])
+        if req.marker is not None and not req.marker.evaluate(
+            {
+                "python_version": python_version,
+                "python_full_version": python_full_version,
+            },
+        ):
+            continue
+        name = canonicalize_name(req.name)
+        specifiers[name] = specifiers.get(name, SpecifierSet()) & req.specifier
+    return {name: str(specifier) for name, specifier in specifiers.items()}
+
+
+def parse_build_requires(
+    path: str | Path, python_version: str, python_full_version: str
+) -> dict[str, str]:
+    """
+    Parse the pyproject.toml file and return a dict of the build requirements and their lower version constraints.
+
+    :param path: path to pyproject.toml file
+    :param python_version: major.minor version of python
+    :param python_full_version: major.minor.patch version of python
+    :return: dict of the ``build-system.requires`` entries that fit to environment
+        and their lower version constraints
+    """
+    with Path(path).open() as f:
+        data = toml_loads(f.read())
+    base_constrains: dict[str, str] = {}
+    for line in data.get("build-system", {}).get("requires", []):
+        base_constrains.update(
+            parse_single_requirement(line, python_version, python_full_version)
+        )
+    return base_constrains
+
+
+def parse_requires_python(path: str | Path) -> str | None:
+    """
+    Parse the supported Python versions of the project.
+
+    :param path: path to pyproject.toml or setup.cfg file
+    :return: ``requires-python`` from pyproject.toml or ``python_requires``
+        from setup.cfg, or None if it is not declared
+    """
+    if Path(path).suffix == ".cfg":
+        config = ConfigParser()
+        config.read(path)
+        return config.get("options", "python_requires", fallback=None) or None
+    with Path(path).open() as f:
+        data = toml_loads(f.read())
+    return data.get("project", {}).get("requires-python") or None
+
+
+def parse_project_name(path: str | Path) -> str | None:
+    """
+    Parse the name of the project.
+
+    :param path: path to pyproject.toml or setup.cfg file
+    :return: name from ``[project]`` table of pyproject.toml or ``[metadata]``
+        section of setup.cfg, or None if it is not declared
+    """
+    if Path(path).suffix == ".cfg":
+        config = ConfigParser()
+        config.read(path)
+        return config.get("metadata", "name", fallback=None) or None
+    with Path(path).open() as f:
+        data = toml_loads(f.read())
+    return data.get("project", {}).get("name") or None
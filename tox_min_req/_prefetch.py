@@ -0,0 +1,93 @@
+"""Module to download pinned distributions in background, while the environment is being prepared."""
+
+from __future__ import annotations
+
+import subprocess
+import threading
+from pathlib import Path
+
+__all__ = ("Prefetch",)
+
+PREFETCH_DIR_NAME = "min_req_prefetch"
+
+
+class Prefetch(threading.Thread):
+    """
+    Download wheels of pinned versions to a directory in a background thread.
+
+    Every environment should use its own directory, so parallel environments
+    never write to the same files. Pins are downloaded by pip of the environment
+    interpreter, so wheels match the interpreter and platform of the environment.
+    Only wheels are downloaded, as sdists would need to be built to download them.
+    Each pin is downloaded by a separate call, because pip aborts the whole call
+    if any requested pin has no wheel, and old versions are often sdist only.
+
+    :param dependencies: mapping of the distribution name to the pinned version
+    :param dest: directory to download wheels to
+    :param python: python executable of the environment
+    """
+
+    def __init__(
+        self, dependencies: dict[str, str], dest: str | Path, python: str | Path
+    ) -> None:
+        super().__init__(name="tox-min-req-prefetch", daemon=True)
+        self.dependencies = dict(dependencies)
+        self.dest = Path(dest)
+        self.python = python
+        self.errors: dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._process: subprocess.Popen[str] | None = None
+        self._cancelled = False
+
+    def command(self, name: str, version: str) -> list[str]:
+        """Build the pip command downloading the pinned distribution."""
+        return [
+            str(self.python),
+            "-m",
+            "pip",
+            "download",
+            "--quiet",
+            "--no-deps",
+            "--only-binary=:all:",
+            "--dest",
+            str(self.dest),
+            f"{name}=={version}",
+        ]
+
+    def run(self) -> None:
+        """Download all pinned distributions, collecting failures per pin."""
+        self.dest.mkdir(parents=True, exist_ok=True)
+        for name, version in self.dependencies.items():
+            error = self._download(name, version)
+            if self._cancelled:
+                return
+            if error is not None:
+                self.errors[f"{name}=={version}"] = error
+
+    def _download(self, name: str, version: str) -> str | None:
+        with self._lock:
+            if self._cancelled:
+                return None
+            try:
+                self._process = subprocess.Popen(
+                    self.command(name, version),
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
+                    text=True,
+                )
+            except OSError as e:
+                return str(e)
+        _, stderr = self._process.communicate()
+        if self._process.returncode == 0:
+            return None
+        lines = stderr.strip().splitlines()
+        return lines[-1] if lines else f"exit code {self._process.returncode}"
+
+    def cancel(self) -> None:
+        """Stop the download and wait for the thread to finish."""
+        with self._lock:
+            self._cancelled = True
+            if self._process is not None and self._process.poll() is None:
+                self._process.terminate()
+        if self.is_alive():
+            self.join()
@@ -0,0 +1,128 @@
+"""Module to select interpreters on which the minimum requirements are tested."""
+
+from __future__ import annotations
+
+import functools
+import os
+from typing import TYPE_CHECKING
+
+from packaging import tags
+from packaging.specifiers import InvalidSpecifier, SpecifierSet
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from ._metadata_store import MetadataStore
+
+__all__ = (
+    "find_oldest_python",
+    "floor_issues",
+    "python_candidates",
+)
+
+_MAX_MINOR = 30
+_MAX_MICRO = 999
+
+
+def python_candidates(requires_python: str) -> list[str]:
+    """
+    List Python 3 release series that may satisfy ``requires-python``.
+
+    :param requires_python: value of ``requires-python``
+    :return: major.minor versions sorted from the oldest
+    """
+    specifier = SpecifierSet(requires_python)
+    return [
+        f"3.{minor}"
+        for minor in range(_MAX_MINOR)
+        if specifier.contains(f"3.{minor}.0", prereleases=True)
+        or specifier.contains(f"3.{minor}.{_MAX_MICRO}", prereleases=True)
+    ]
+
+
+@functools.lru_cache(maxsize=None)
+def find_oldest_python(
+    requires_python: str, try_first_with: tuple[str, ...] = ()
+) -> tuple[int, int, int] | None:
+    """
+    Find the oldest interpreter allowed by ``requires-python``.
+
+    Interpreters are discovered in the same way as tox (and virtualenv) does it.
+    The result is cached, as the discovery has to inspect the interpreters.
+
+    :param requires_python: value of ``requires-python``
+    :param try_first_with: paths of interpreters to check first (``--discover``)
+    :return: version of the oldest found interpreter or None if there is none
+    """
+    # imported here, so a change of the virtualenv API breaks only this feature
+    from virtualenv.discovery.builtin import get_interpreter  # noqa: PLC0415
+
+    specifier = SpecifierSet(requires_python)
+    for version in python_candidates(requires_python):
+        interpreter = get_interpreter(version, try_first_with, env=os.environ)
+        if interpreter is None:
+            continue
+        version_info = tuple(interpreter.version_info[:3])
+        if specifier.contains(".".join(str(x) for x in version_info), prereleases=True):
+            return version_info  # type: ignore[return-value]
+    return None
+
+
+def _supported_tags(version_info: Sequence[int], implementation: str) -> set[tags.Tag]:
+    python_version = tuple(version_info[:2])
+    if implementation != "CPython":
+        return set(tags.compatible_tags(python_version))
+    interpreter = f"cp{python_version[0]}{python_version[1]}"
+    supported = set(tags.cpython_tags(python_version))
+    supported.update(tags.compatible_tags(python_version, interpreter))
+    return supported
+
+
+def floor_issues(
+    store: MetadataStore,
+    dependencies: dict[str, str],
+    version_info: Sequence[int],
+    implementation: str = "CPython",
+    check_wheel_tags: bool = False,
+) -> dict[str, str]:
+    """
+    Check in the package metadata store if the pinned versions install on the interpreter.
+
+    A version is not installable if its ``Requires-Python`` excludes
+    the interpreter. Optionally, it is also not installable if none of its known
+    wheels is compatible with the interpreter (old versions usually fail to build
+    from sdist on newer interpreters). As the store is filled from local wheels,
+    it may miss compatible ones, so this check is opt-in.
+    Versions missing in the store are assumed to be installable.
+
+    :param store: package metadata store
+    :param dependencies: pinned versions
+    :param version_info: version of the interpreter
+    :param implementation: implementation of the interpreter, e.g. ``CPython``
+    :param check_wheel_tags: also report versions without a compatible known wheel
+    :return: mapping of ``name==version`` of not installable pins to the reason
+    """
+    full_version = ".".join(str(x) for x in version_info[:3])
+    supported: set[tags.Tag] | None = None
+    issues: dict[str, str] = {}
+    for name, version in dependencies.items():
+        info = store.get(name, version)
+        if info is None:
+            continue
+        if info.requires_python:
+            try:
+                allowed = SpecifierSet(info.requires_python).contains(
+                    full_version, prereleases=True
+                )
+            except InvalidSpecifier:
+                allowed = True
+            if not allowed:
+                issues[f"{name}=={version}"] = f"requires Python {info.requires_python}"
+                continue
+        if check_wheel_tags and info.wheel_tags:
+            if supported is None:
+                supported = _supported_tags(version_info, implementation)
+            wheel_tags = {x for tag in info.wheel_tags for x in tags.parse_tag(tag)}
+            if supported.isdisjoint(wheel_tags):
+                issues[f"{name}=={version}"] = "no compatible wheel"
+    return issues
@@ -0,0 +1,154 @@
+"""Module to export and import installed min_req environments as relocatable archives."""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import os
+import re
+import shutil
+import tarfile
+import tempfile
+from pathlib import Path
+from typing import Any
+
+__all__ = (
+    "export_snapshot",
+    "import_snapshot",
+    "read_snapshot_metadata",
+    "snapshot_key",
+)
+
+SNAPSHOT_METADATA = "min_req_snapshot.json"
+
+_ENV_ARCNAME = "env"
+_SKIP_DIRS = {"tmp", "log", "__pycache__"}
+_MAX_REWRITE_SIZE = 1024 * 1024
+
+
+def snapshot_key(data: dict[str, Any]) -> str:
+    """
+    Compute the key of the snapshot from the data describing the environment.
+
+    :param data: JSON serializable interpreter, platform, pins and extras
+    :return: hex digest of the data
+    """
+    return hashlib.sha256(json.dumps(data, sort_keys=True).encode()).hexdigest()
+
+
+def _skip(tar_info: tarfile.TarInfo) -> tarfile.TarInfo | None:
+    parts = Path(tar_info.name).parts
+    if (len(parts) > 1 and parts[1] in _SKIP_DIRS) or "__pycache__" in parts:
+        return None
+    return tar_info
+
+
+def export_snapshot(
+    env_dir: str | Path, archive: str | Path, metadata: dict[str, Any]
+) -> None:
+    """
+    Pack the environment directory together with metadata into the archive.
+
+    Temporary and log directories of the environment are skipped.
+
+    :param env_dir: directory of the environment
+    :param archive: path of the created ``.tar.gz`` archive
+    :param metadata: JSON serializable metadata, it should contain ``key``
+        and absolute paths to rewrite on import (``env_dir`` and ``tox_root``)
+    """
+    archive = Path(archive)
+    archive.parent.mkdir(parents=True, exist_ok=True)
+    data = json.dumps(metadata, indent=2).encode()
+    tmp_archive = archive.with_name(f"{archive.name}.tmp")
+    with tarfile.open(tmp_archive, "w:gz") as tar:
+        info = tarfile.TarInfo(SNAPSHOT_METADATA)
+        info.size = len(data)
+        tar.addfile(info, io.BytesIO(data))
+        tar.add(str(env_dir), arcname=_ENV_ARCNAME, filter=_skip)
+    tmp_archive.replace(archive)
+
+
+def read_snapshot_metadata(archive: str | Path) -> dict[str, Any]:
+    """Read metadata stored in the archive by :func:`export_snapshot`."""
+    with tarfile.open(archive, "r:gz") as tar:
+        member = tar.extractfile(SNAPSHOT_METADATA)
+        if member is None:  # pragma: no cover
+            msg = f"{archive} is not a min-req snapshot"
+            raise ValueError(msg)
+        return json.loads(member.read())
+
+
+def _extract(tar: tarfile.TarFile, dest: Path) -> None:
+    members = [
+        x
+        for x in tar.getmembers()
+        if x.name == _ENV_ARCNAME or x.name.startswith(f"{_ENV_ARCNAME}/")
+    ]
+    if hasattr(tarfile, "tar_filter"):
+        # links of virtual environments point to the base interpreter
+        tar.extractall(dest, members=members, filter="tar")
+    else:  # pragma: no cover
+        tar.extractall(dest, members=members)
+
+
+def _rewrite_file(path: Path, replacements: dict[bytes, bytes]) -> None:
+    if path.is_symlink() or not path.is_file():
+        return
+    if path.stat().st_size > _MAX_REWRITE_SIZE:
+        return
+    content = path.read_bytes()
+    if b"\0" in content[:8192]:
+        return
+    # single pass, as the new path could contain the old one (e.g. as a prefix)
+    pattern = re.compile(
+        b"|".join(re.escape(x) for x in sorted(replacements, key=len, reverse=True))
+    )
+    new_content = pattern.sub(lambda x: replacements[x.group(0)], content)
+    if new_content != content:
+        path.write_bytes(new_content)
+
+
+def _files_to_rewrite(env_dir: Path) -> list[Path]:
+    files = [x for x in env_dir.iterdir() if x.is_file()]
+    for scripts in ("bin", "Scripts"):
+        if (env_dir / scripts).is_dir():
+            files.extend((env_dir / scripts).iterdir())
+    files.extend(env_dir.rglob("*.pth"))
+    files.extend(env_dir.rglob("*.egg-link"))
+    files.extend(env_dir.rglob("direct_url.json"))
+    # setuptools editable installs embed source paths in the finder module
+    files.extend(env_dir.rglob("__editable___*_finder.py"))
+    return files
+
+
+def import_snapshot(
+    archive: str | Path, env_dir: str | Path, paths: dict[str, str]
+) -> None:
+    """
+    Replace the environment directory with the content of the archive.
+
+    Absolute paths recorded in metadata are rewritten to the new ones in scripts,
+    configuration and ``.pth`` files of the environment.
+
+    :param archive: archive created by :func:`export_snapshot`
+    :param env_dir: directory of the environment
+    :param paths: new values of the paths recorded in metadata
+        (``env_dir``, ``tox_root``)
+    """
+    env_dir = Path(env_dir)
+    metadata = read_snapshot_metadata(archive)
+    replacements = {
+        str(metadata[name]).encode(): str(paths[name]).encode()
+        for name in ("env_dir", "tox_root")
+        if metadata.get(name) and str(metadata[name]) != str(paths[name])
+    }
+    env_dir.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory(dir=env_dir.parent) as tmp_dir:
+        with tarfile.open(archive, "r:gz") as tar:
+            _extract(tar, Path(tmp_dir))
+        shutil.rmtree(env_dir, ignore_errors=True)
+        os.replace(Path(tmp_dir) / _ENV_ARCNAME, env_dir)
+    if replacements:
+        for path in _files_to_rewrite(env_dir):
+            _rewrite_file(path, replacements)
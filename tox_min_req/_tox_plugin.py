@@ -1,67 +1,293 @@
 from __future__ import annotations
 
+import hashlib
+import itertools
+import json
+import logging
 import os
+import queue
+import shutil
+import subprocess
+import sys
+import threading
+import time
+import weakref
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, cast
 
+from packaging.requirements import InvalidRequirement, Requirement
+from packaging.specifiers import SpecifierSet
+from packaging.utils import canonicalize_name
+from tox.config.cli.parser import CORE
 from tox.plugin import impl
+from tox.session.cmd.run.common import env_run_create_flags
+from tox.session.env_select import CliEnv, register_env_select_flags
+from tox.tox_env.errors import Fail, Recreate, Skip
 
+from ._change_detection import (
+    STATE_FILE_NAME,
+    files_hash,
+    load_state,
+    save_state,
+    source_tree_hash,
+)
+from ._covering import covering_array, representative_versions
+from ._ddmin import ddmin
+from ._import_trace import (
+    IMPORTS_FILE_NAME,
+    TRACE_DIR_ENV,
+    TRACE_DIR_NAME,
+    imported_distributions,
+    install_tracer,
+    read_traced_modules,
+    unused_dependencies,
+)
+from ._install_report import PIP_LOG_FILE_NAME, REPORT_FILE_NAME, parse_pip_log
+from ._learned_pins import (
+    LEARNED_PINS_FILE_NAME,
+    LearnedPins,
+    learn_from_pip_log,
+    project_key,
+)
+from ._metadata_store import STORE_FILE_NAME, MetadataStore
 from ._parse_dependencies import (
+    parse_build_requires,
+    parse_project_name,
+    parse_pyproject_specifiers,
     parse_pyproject_toml,
+    parse_requires_python,
     parse_setup_cfg,
+    parse_setup_cfg_specifiers,
     parse_single_requirement,
 )
+from ._prefetch import PREFETCH_DIR_NAME, Prefetch
+from ._requires_python import find_oldest_python, floor_issues
+from ._snapshot import (
+    export_snapshot,
+    import_snapshot,
+    read_snapshot_metadata,
+    snapshot_key,
+)
+from ._watch import create_watcher
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from tox.config.cli.parser import ToxParser
+    from tox.config.sets import CoreConfigSet
+    from tox.execute import Outcome
     from tox.session.state import State
     from tox.tox_env.api import EnvConfigSet, ToxEnv
+    from tox.tox_env.python.api import Python
+    from tox.tox_env.python.runner import PythonRun
 
 
 CONSTRAINTS_FILE_NAME = "min_req_constraints.txt"
+BUILD_CONSTRAINTS_FILE_NAME = "min_req_build_constraints.txt"
+BUILD_STATE_FILE_NAME = "min_req_build_state.json"
+BISECT_DIR_NAME = "min_req_bisect"
+SUBSET_ENV = "TOX_MIN_REQ_SUBSET"
+MIN_REQ_PYTHON_MODES = ("all", "oldest", "installable")
+# name of the environment and hash seed randomized for every tox invocation
+_ENV_SPECIFIC_VARS = {"TOX_ENV_NAME", "PYTHONHASHSEED"}
+
+_fingerprints_lock = threading.Lock()
+_seen_fingerprints: weakref.WeakKeyDictionary[CoreConfigSet, dict[str, str]] = (
+    weakref.WeakKeyDictionary()
+)
+_pending_states: weakref.WeakKeyDictionary[ToxEnv, dict[str, str]] = (
+    weakref.WeakKeyDictionary()
+)
+_learn_keys: weakref.WeakKeyDictionary[ToxEnv, tuple[str, list[str], str | None]] = (
+    weakref.WeakKeyDictionary()
+)
+_prefetches: weakref.WeakKeyDictionary[ToxEnv, Prefetch] = weakref.WeakKeyDictionary()
+_trace_declared: weakref.WeakKeyDictionary[ToxEnv, list[str]] = (
+    weakref.WeakKeyDictionary()
+)
 
 
-def _write_constrains_file(
-    tox_env: ToxEnv, dependencies: dict[str, str], extra_lines: list[str]
-) -> Path:
+def _append_env_path(tox_env: ToxEnv, name: str, path: Path) -> None:
+    if str(path) in tox_env.environment_variables.get(name, "").split(" "):
+        return
+    if tox_env.environment_variables.get(name, ""):
+        tox_env.environment_variables[name] += f" {path!s}"
+    else:
+        tox_env.environment_variables[name] = str(path)
+
+
+def _constraints_path(tox_env: ToxEnv) -> Path:
     if tox_env.options.min_req_constraints_path:
         base_path = Path(tox_env.options.min_req_constraints_path)
-        constrain_file = (
-            base_path / CONSTRAINTS_FILE_NAME if base_path.is_dir() else base_path
-        )
-    elif os.environ.get("TOX_MIN_REQ_CONSTRAINTS", ""):
+        return base_path / CONSTRAINTS_FILE_NAME if base_path.is_dir() else base_path
+    if os.environ.get("TOX_MIN_REQ_CONSTRAINTS", ""):
         base_path = Path(os.environ["TOX_MIN_REQ_CONSTRAINTS"])
-        constrain_file = (
-            base_path / CONSTRAINTS_FILE_NAME if base_path.is_dir() else base_path
-        )
-    else:
-        constrain_file = tox_env.env_tmp_dir.parent / CONSTRAINTS_FILE_NAME
+        return base_path / CONSTRAINTS_FILE_NAME if base_path.is_dir() else base_path
+    return tox_env.env_tmp_dir.parent / CONSTRAINTS_FILE_NAME
 
-    with constrain_file.open("w") as f:
-        f.write("\n".join(f"{n}=={v}" for n, v in dependencies.items()))
-        f.write("\n")
-        f.write("\n".join(extra_lines))
 
-    if tox_env.environment_variables.get("PIP_CONSTRAINT", ""):
-        tox_env.environment_variables["PIP_CONSTRAINT"] += f" {constrain_file!s}"
-    else:
-        tox_env.environment_variables["PIP_CONSTRAINT"] = str(constrain_file)
+def _format_constraints(
+    dependencies: dict[str, str], extra_lines: list[str], learned: list[str]
+) -> str:
+    pins = "\n".join([*(f"{n}=={v}" for n, v in dependencies.items()), *learned])
+    return pins + "\n" + "\n".join(extra_lines)
 
-    if tox_env.environment_variables.get("UV_CONSTRAINT", ""):
-        tox_env.environment_variables["UV_CONSTRAINT"] += f" {constrain_file!s}"
-    else:
-        tox_env.environment_variables["UV_CONSTRAINT"] = str(constrain_file)
+
+def _write_constrains_file(
+    tox_env: ToxEnv,
+    dependencies: dict[str, str],
+    extra_lines: list[str],
+    learned: list[str],
+) -> Path:
+    constrain_file = _constraints_path(tox_env)
+    constrain_file.write_text(_format_constraints(dependencies, extra_lines, learned))
+
+    _append_env_path(tox_env, "PIP_CONSTRAINT", constrain_file)
+    _append_env_path(tox_env, "UV_CONSTRAINT", constrain_file)
 
     return constrain_file
 
 
-@impl
-def tox_on_install(tox_env: ToxEnv, arguments: Any, section: str, of_type: str) -> None:
-    if of_type != "deps" or section != "PythonRun":
-        return
-    if os.environ.get("MIN_REQ", "0") != "1" and not tox_env.conf["min_req"]:
+def _learned_pins(tox_env: ToxEnv) -> LearnedPins:
+    return LearnedPins(tox_env.core["work_dir"] / LEARNED_PINS_FILE_NAME)
+
+
+def _project_name(tox_env: ToxEnv) -> str | None:
+    project_path = tox_env.core["package_root"]
+    for file_name in ("pyproject.toml", "setup.cfg"):
+        if (project_path / file_name).exists():
+            name = parse_project_name(project_path / file_name)
+            if name is not None:
+                return name
+    return None
+
+
+def _min_req_enabled(tox_env: ToxEnv) -> bool:
+    return os.environ.get("MIN_REQ", "0") == "1" or tox_env.conf["min_req"]
+
+
+def _min_req_env(tox_env: ToxEnv) -> PythonRun | None:
+    """
+    Get the environment if min-req is enabled in it, or None otherwise.
+
+    min-req is only used in environments installing Python dependencies
+    (tox calls the install hook for them with the ``PythonRun`` section),
+    so the environment is typed as such.
+    """
+    return cast("PythonRun", tox_env) if _min_req_enabled(tox_env) else None
+
+
+def _sample_assignments(tox_env: PythonRun) -> list[dict[str, str]]:
+    """
+    Generate the covering set of version assignments for the environment.
+
+    Versions are taken from the package metadata store and filtered
+    by the specifiers of the dependencies.
+    """
+    specifiers = _project_specifiers(tox_env)
+    store = _metadata_store(tox_env.options, tox_env.core["work_dir"])
+    parameters = {
+        name: representative_versions(store.versions(name), specifier)
+        for name, specifier in specifiers.items()
+    }
+    return covering_array(
+        parameters,
+        strength=tox_env.conf["min_req_sample_strength"],
+        seed=tox_env.conf["min_req_sample_seed"],
+    )
+
+
+def _apply_sample(tox_env: PythonRun, dependencies: dict[str, str]) -> None:
+    try:
+        index = int(tox_env.conf["min_req_sample"])
+    except ValueError as e:
+        msg = (
+            f"min_req_sample should be an integer, got {tox_env.conf['min_req_sample']}"
+        )
+        raise Fail(msg) from e
+    assignments = _sample_assignments(tox_env)
+    if not assignments:
+        logging.warning(
+            "min-req sample skipped, no known versions in the metadata store "
+            "(fill it with tox min-req-store --fill)"
+        )
         return
+    canonical: dict[str, str] = {canonicalize_name(x): x for x in dependencies}
+    for name, version in assignments[index % len(assignments)].items():
+        dependencies[canonical.get(name, name)] = version
+
+
+def _requires_python(tox_env: ToxEnv) -> str:
+    project_path = tox_env.core["package_root"]
+    for file_name in ("pyproject.toml", "setup.cfg"):
+        if (project_path / file_name).exists():
+            requires_python = parse_requires_python(project_path / file_name)
+            if requires_python is not None:
+                return requires_python
+    msg = (
+        "min_req_python requires requires-python in pyproject.toml "
+        "or python_requires in setup.cfg"
+    )
+    raise Fail(msg)
+
+
+def _python_skip_reason(tox_env: PythonRun, dependencies: dict[str, str]) -> str | None:
+    """
+    Check if the minimum requirements should be tested on the environment interpreter.
+
+    :param tox_env: tox environment
+    :param dependencies: pinned versions computed for the environment
+    :return: reason why min-req is not used in the environment,
+        or None if it is used
+    """
+    mode = tox_env.conf["min_req_python"]
+    if mode == "all":
+        return None
+    if mode not in MIN_REQ_PYTHON_MODES:
+        msg = (
+            f"min_req_python should be one of {', '.join(MIN_REQ_PYTHON_MODES)}, "
+            f"got {mode}"
+        )
+        raise Fail(msg)
+    requires_python = _requires_python(tox_env)
+    version_info = tuple(tox_env.base_python.version_info[:3])
+    version = ".".join(str(x) for x in version_info)
+    if not SpecifierSet(requires_python).contains(version, prereleases=True):
+        return f"Python {version} is not allowed by requires-python {requires_python}"
+    oldest = find_oldest_python(requires_python, tuple(tox_env.options.discover))
+    if oldest is None or oldest[:2] >= version_info[:2]:
+        return None
+    store = _metadata_store(tox_env.options, tox_env.core["work_dir"])
+    issues = floor_issues(
+        store,
+        dependencies,
+        version_info,
+        tox_env.base_python.implementation,
+        tox_env.conf["min_req_python_wheel_tags"],
+    )
+    if issues:
+        details = ", ".join(f"{pin} ({reason})" for pin, reason in issues.items())
+        return f"minimum versions are not installable on Python {version}: {details}"
+    if mode == "oldest":
+        oldest_version = ".".join(str(x) for x in oldest)
+        return (
+            f"Python {oldest_version} is the oldest interpreter "
+            f"allowed by requires-python {requires_python}"
+        )
+    return None
+
 
+def _compute_constraints(
+    tox_env: PythonRun,
+) -> tuple[dict[str, str], list[str], list[str]] | None:
+    """
+    Compute the minimum requirements pins for the environment.
+
+    :param tox_env: tox environment to compute constraints for
+    :return: pinned versions, ``-r``/``-c`` lines of the constraints file
+        and constraints learned in previous runs, or None if there is
+        no supported project configuration file
+    """
     project_path = tox_env.core["package_root"]
     python_version = ".".join(str(x) for x in tox_env.base_python.version_info[:2])
     python_full_version = ".".join(str(x) for x in tox_env.base_python.version_info[:3])
@@ -80,7 +306,10 @@ def tox_on_install(tox_env: ToxEnv, arguments: Any, section: str, of_type: str)
             dependency_groups,
         )
     else:  # pragma: no cover
-        return
+        return None
+
+    if tox_env.conf["min_req_sample"]:
+        _apply_sample(tox_env, dependencies)
 
     extra_lines = []
 
@@ -98,7 +327,796 @@ def tox_on_install(tox_env: ToxEnv, arguments: Any, section: str, of_type: str)
                     )
                 )
 
-    _write_constrains_file(tox_env, dependencies, extra_lines)
+    subset = os.environ.get(SUBSET_ENV)
+    if subset is not None:
+        keep = {canonicalize_name(x) for x in subset.split(",") if x}
+        dependencies = {
+            k: v for k, v in dependencies.items() if canonicalize_name(k) in keep
+        }
+
+    learned = []
+    if tox_env.conf["min_req_learn_pins"]:
+        key = project_key(dependencies, python_version)
+        project = _project_name(tox_env)
+        _learn_keys[tox_env] = (key, list(dependencies), project)
+        skip = {canonicalize_name(project)} if project is not None else set()
+        learned = [
+            x
+            for x in _learned_pins(tox_env).get(key)
+            if canonicalize_name(Requirement(x).name) not in skip
+        ]
+
+    return dependencies, extra_lines, learned
+
+
+def _fingerprint(
+    tox_env: PythonRun,
+    dependencies: dict[str, str],
+    extra_lines: list[str],
+    learned: list[str],
+) -> str:
+    """
+    Compute fingerprint of what the min_req environment installs and runs.
+
+    Environments with the same fingerprint are equivalent, even if their names
+    differ in factors that influence neither the installed packages nor
+    the environment and commands of the run.
+    """
+    env_dir = str(tox_env.env_dir)
+    set_env = tox_env.conf["set_env"]
+    data = {
+        "python": [
+            tox_env.base_python.implementation,
+            list(tox_env.base_python.version_info[:3]),
+            tox_env.base_python.platform,
+            tox_env.base_python.is_64,
+        ],
+        "constraints": sorted(dependencies.items()),
+        "extra_lines": extra_lines,
+        "learned": learned,
+        "extras": sorted(tox_env.conf["extras"]),
+        "dependency_groups": sorted(tox_env.conf["dependency_groups"]),
+        "deps": tox_env.conf["deps"].lines(),
+        "set_env": {
+            key: set_env.load(key).replace(env_dir, "{env_dir}")
+            for key in set_env
+            if key not in _ENV_SPECIFIC_VARS
+        },
+        **{
+            key: [
+                [x.replace(env_dir, "{env_dir}") for x in cmd.args]
+                for cmd in tox_env.conf[key]
+            ]
+            for key in ("commands_pre", "commands", "commands_post")
+        },
+    }
+    return hashlib.sha256(json.dumps(data, sort_keys=True).encode()).hexdigest()
+
+
+def _check_duplicate(tox_env: ToxEnv, fingerprint: str) -> None:
+    with _fingerprints_lock:
+        seen = _seen_fingerprints.setdefault(tox_env.core, {})
+        first_env = seen.setdefault(fingerprint, tox_env.name)
+    if first_env != tox_env.name:
+        msg = f"min-req environment is a duplicate of {first_env}"
+        raise Skip(msg)
+
+
+def _constraint_files(tox_env: ToxEnv, extra_lines: list[str]) -> list[Path]:
+    """Get paths of files referenced by ``-r``/``-c`` lines, relative to tox root."""
+    return [
+        (tox_env.core["tox_root"] / x[2:].strip()).absolute()
+        for x in extra_lines
+        if x.startswith(("-r", "-c"))
+    ]
+
+
+def _check_unchanged(tox_env: ToxEnv, fingerprint: str, extra_lines: list[str]) -> bool:
+    """
+    Check if nothing relevant changed since the last successful run of the environment.
+
+    If something changed, the new state is saved after the commands succeed.
+
+    :return: True if the environment is up to date
+    """
+    state = {
+        "fingerprint": fingerprint,
+        "constraint_files": files_hash(_constraint_files(tox_env, extra_lines)),
+        "source": source_tree_hash(tox_env.core["package_root"]),
+    }
+    if load_state(tox_env.env_dir / STATE_FILE_NAME) == state:
+        return True
+    _pending_states[tox_env] = state
+    return False
+
+
+def _run_no_commands(tox_env: ToxEnv) -> None:
+    """
+    Make the environment run no commands, so it succeeds instead of being skipped.
+
+    tox reports a failure if all selected environments are skipped.
+    The loaded values are replaced (as tox does for ``package``), not cleared,
+    so lists already read by others stay intact.
+    """
+    for key in ("commands_pre", "commands", "commands_post"):
+        tox_env.conf._defined[key].overwrite([])
+
+
+def _start_prefetch(tox_env: PythonRun, dependencies: dict[str, str]) -> None:
+    prefetch = Prefetch(
+        dependencies, tox_env.env_dir / PREFETCH_DIR_NAME, tox_env.env_python()
+    )
+    prefetch.start()
+    _prefetches[tox_env] = prefetch
+
+
+def _finish_prefetch(tox_env: ToxEnv) -> None:
+    prefetch = _prefetches.pop(tox_env, None)
+    if prefetch is None:
+        return
+    prefetch.join()
+    if prefetch.errors:
+        logging.warning(
+            "min-req prefetch failed for %s, they are downloaded by the installer:\n%s",
+            ", ".join(prefetch.errors),
+            "\n".join(f"{k}: {v}" for k, v in prefetch.errors.items()),
+        )
+    _append_env_path(tox_env, "PIP_FIND_LINKS", prefetch.dest)
+    _append_env_path(tox_env, "UV_FIND_LINKS", prefetch.dest)
+
+
+def _cancel_prefetch(tox_env: ToxEnv) -> None:
+    """Stop the download if no package was installed (e.g. ``skip_install``)."""
+    prefetch = _prefetches.pop(tox_env, None)
+    if prefetch is not None:
+        prefetch.cancel()
+
+
+def _min_req_build_enabled(tox_env: ToxEnv) -> bool:
+    return os.environ.get("MIN_REQ_BUILD", "0") == "1" or tox_env.conf["min_req_build"]
+
+
+def _pin_build_env(tox_env: Python) -> None:
+    """
+    Constrain the build requirements of the package environment to minimum versions.
+
+    The pinned build requirements are installed once and reused by following
+    builds and runs. The package environment is recreated when the pin set changes
+    or when the pins are not used anymore.
+
+    :param tox_env: package environment
+    """
+    state_file = tox_env.env_dir / BUILD_STATE_FILE_NAME
+    old_state = load_state(state_file)
+    pyproject = tox_env.core["package_root"] / "pyproject.toml"
+    if not _min_req_build_enabled(tox_env) or not pyproject.exists():
+        if old_state is not None:
+            state_file.unlink()
+            msg = "min-req build pins are not used anymore"
+            raise Recreate(msg)
+        return
+
+    python_version = ".".join(str(x) for x in tox_env.base_python.version_info[:2])
+    python_full_version = ".".join(str(x) for x in tox_env.base_python.version_info[:3])
+    dependencies = parse_build_requires(pyproject, python_version, python_full_version)
+    content = _format_constraints(dependencies, [], [])
+    state = {"pins": hashlib.sha256(content.encode()).hexdigest()}
+    if old_state is not None and old_state != state:
+        state_file.unlink()
+        msg = "min-req build pins changed"
+        raise Recreate(msg)
+
+    constraints_file = tox_env.env_dir / BUILD_CONSTRAINTS_FILE_NAME
+    constraints_file.write_text(content)
+    save_state(state_file, state)
+    _append_env_path(tox_env, "PIP_CONSTRAINT", constraints_file)
+    _append_env_path(tox_env, "UV_CONSTRAINT", constraints_file)
+
+
+def _constrain_run_env(tox_env: PythonRun) -> None:
+    constraints = _compute_constraints(tox_env)
+    if constraints is None:  # pragma: no cover
+        return
+    dependencies, extra_lines, learned = constraints
+    reason = _python_skip_reason(tox_env, dependencies)
+    if reason is not None:
+        _learn_keys.pop(tox_env, None)
+        logging.warning("min-req disabled: %s", reason)
+        return
+
+    fingerprint = _fingerprint(tox_env, dependencies, extra_lines, learned)
+    tox_env.environment_variables["TOX_MIN_REQ_FINGERPRINT"] = fingerprint
+    if tox_env.options.min_req_skip_duplicates:
+        _check_duplicate(tox_env, fingerprint)
+    unchanged = tox_env.conf["min_req_skip_unchanged"] and _check_unchanged(
+        tox_env, fingerprint, extra_lines
+    )
+
+    _write_constrains_file(tox_env, dependencies, extra_lines, learned)
+
+    if unchanged:
+        logging.warning(
+            "min-req environment is up to date, commands are not run "
+            "(recreate the environment to force the run)"
+        )
+        _run_no_commands(tox_env)
+        return
+
+    if tox_env.conf["min_req_prefetch"] and not tox_env.conf["skip_install"]:
+        _start_prefetch(tox_env, dependencies)
+
+    if tox_env.conf["min_req_trace_imports"]:
+        _trace_declared[tox_env] = _declared_names(tox_env)
+
+    if tox_env.conf["min_req_install_report"] or tox_env.conf["min_req_learn_pins"]:
+        pip_log = tox_env.env_dir / PIP_LOG_FILE_NAME
+        if pip_log.exists():
+            pip_log.unlink()
+        tox_env.environment_variables["PIP_LOG"] = str(pip_log)
+
+
+@impl
+def tox_on_install(tox_env: ToxEnv, arguments: Any, section: str, of_type: str) -> None:
+    if of_type == "package" and section == "RunToxEnv":
+        _finish_prefetch(tox_env)
+    elif of_type == "requires" and section == "PythonPackageToxEnv":
+        _pin_build_env(cast("Python", tox_env))
+    elif of_type == "deps" and section == "PythonRun":
+        run_env = _min_req_env(tox_env)
+        if run_env is not None:
+            _constrain_run_env(run_env)
+
+
+def _report_install_cost(tox_env: ToxEnv) -> None:
+    if tox_env.environment_variables.get("PIP_LOG", "") != str(
+        tox_env.env_dir / PIP_LOG_FILE_NAME
+    ):
+        return
+    del tox_env.environment_variables["PIP_LOG"]
+    pip_log = tox_env.env_dir / PIP_LOG_FILE_NAME
+    if not tox_env.conf["min_req_install_report"] or not pip_log.exists():
+        return
+    with pip_log.open() as f:
+        report = parse_pip_log(f)
+    report_file = tox_env.env_dir / REPORT_FILE_NAME
+    report_file.write_text(json.dumps(report.to_json(), indent=2))
+    logging.warning(
+        "min-req install cost (full report in %s):\n%s", report_file, report.format()
+    )
+
+
+def _project_specifiers(tox_env: PythonRun) -> dict[str, str]:
+    """
+    Get version specifiers of all dependencies declared by the project.
+
+    The same configuration file as for the minimum requirements is used.
+    """
+    project_path = tox_env.core["package_root"]
+    python_version = ".".join(str(x) for x in tox_env.base_python.version_info[:2])
+    python_full_version = ".".join(str(x) for x in tox_env.base_python.version_info[:3])
+    if (project_path / "setup.cfg").exists():
+        return parse_setup_cfg_specifiers(
+            project_path / "setup.cfg",
+            python_version,
+            python_full_version,
+            tox_env.conf["extras"],
+        )
+    if (project_path / "pyproject.toml").exists():
+        return parse_pyproject_specifiers(
+            project_path / "pyproject.toml",
+            python_version,
+            python_full_version,
+            tox_env.conf["extras"],
+            tox_env.conf["dependency_groups"],
+        )
+    return {}  # pragma: no cover
+
+
+def _declared_names(tox_env: PythonRun) -> list[str]:
+    """Get canonical names of requirements of the project and ``deps``."""
+    names = set(_project_specifiers(tox_env))
+    for line in tox_env.conf["deps"].lines():
+        try:
+            names.add(canonicalize_name(Requirement(line).name))
+        except InvalidRequirement:  # options and -r/-c lines
+            continue
+    return sorted(names)
+
+
+def _start_import_trace(tox_env: PythonRun) -> None:
+    trace_dir = tox_env.env_dir / TRACE_DIR_NAME
+    shutil.rmtree(trace_dir, ignore_errors=True)
+    trace_dir.mkdir(parents=True)
+    install_tracer(tox_env.env_site_package_dir())
+    tox_env.environment_variables[TRACE_DIR_ENV] = str(trace_dir)
+
+
+def _finish_import_trace(tox_env: PythonRun) -> None:
+    declared = _trace_declared.pop(tox_env, None)
+    if declared is None or TRACE_DIR_ENV not in tox_env.environment_variables:
+        return
+    del tox_env.environment_variables[TRACE_DIR_ENV]
+    modules = read_traced_modules(tox_env.env_dir / TRACE_DIR_NAME)
+    distributions = imported_distributions(tox_env.env_python(), modules)
+    report = {
+        "declared": declared,
+        "imported": sorted(distributions),
+        "modules": sorted(modules),
+    }
+    report_file = tox_env.env_dir / IMPORTS_FILE_NAME
+    report_file.write_text(json.dumps(report, indent=2))
+    unused = unused_dependencies([report])
+    if unused:
+        logging.warning(
+            "min-req dependencies not imported by commands: %s (details in %s)",
+            ", ".join(unused),
+            report_file,
+        )
+
+
+@impl
+def tox_before_run_commands(tox_env: ToxEnv) -> None:
+    _cancel_prefetch(tox_env)
+    _report_install_cost(tox_env)
+    if tox_env in _trace_declared:
+        _start_import_trace(cast("PythonRun", tox_env))
+
+
+@impl
+def tox_env_teardown(tox_env: ToxEnv) -> None:
+    _cancel_prefetch(tox_env)
+    learn_key = _learn_keys.pop(tox_env, None)
+    if learn_key is None:
+        return
+    pip_log = tox_env.env_dir / PIP_LOG_FILE_NAME
+    if not pip_log.exists():
+        return
+    key, pinned, project = learn_key
+    with pip_log.open() as f:
+        learned = learn_from_pip_log(f, pinned, project)
+    store = _learned_pins(tox_env)
+    new = store.add(key, learned)
+    if new:
+        logging.warning(
+            "min-req learned indirect pins %s, they will be used in the next run "
+            "(saved in %s)",
+            ", ".join(new),
+            store.path,
+        )
+
+
+@impl
+def tox_after_run_commands(
+    tox_env: ToxEnv, exit_code: int, outcomes: list[Outcome]
+) -> None:
+    state = _pending_states.pop(tox_env, None)
+    if state is not None and exit_code == 0:
+        save_state(tox_env.env_dir / STATE_FILE_NAME, state)
+    if tox_env in _trace_declared:
+        _finish_import_trace(cast("PythonRun", tox_env))
+
+
+def _dry_run_env(env: ToxEnv) -> dict[str, Any]:
+    tox_env = _min_req_env(env)
+    if tox_env is None:
+        return {"enabled": False}
+    try:
+        constraints = _compute_constraints(tox_env)
+        if constraints is None:  # pragma: no cover
+            return {"enabled": True, "error": "no setup.cfg or pyproject.toml found"}
+        dependencies, extra_lines, learned = constraints
+        reason = _python_skip_reason(tox_env, dependencies)
+    except (Skip, Fail) as e:
+        return {"enabled": True, "error": str(e) or type(e).__name__}
+    if reason is not None:
+        return {"enabled": False, "reason": reason}
+    return {
+        "enabled": True,
+        "constraints": dependencies,
+        "learned": learned,
+        "extra_lines": extra_lines,
+        "fingerprint": _fingerprint(tox_env, dependencies, extra_lines, learned),
+    }
+
+
+def _deduplicated_matrix(result: dict[str, dict[str, Any]]) -> list[dict[str, Any]]:
+    matrix: list[dict[str, Any]] = []
+    by_fingerprint: dict[str, dict[str, Any]] = {}
+    for name, data in result.items():
+        fingerprint = data.get("fingerprint")
+        if fingerprint in by_fingerprint:
+            by_fingerprint[fingerprint]["duplicates"].append(name)
+            continue
+        entry: dict[str, Any] = {
+            "env": name,
+            "fingerprint": fingerprint,
+            "duplicates": [],
+        }
+        if fingerprint is not None:
+            by_fingerprint[fingerprint] = entry
+        matrix.append(entry)
+    return matrix
+
+
+def min_req_dry_run(state: State) -> int:
+    """Print the constraints of the selected environments without provisioning them."""
+    result = {name: _dry_run_env(state.envs[name]) for name in state.envs.iter()}
+    output_file = state.conf.options.min_req_output_file
+    if output_file is not None:
+        Path(output_file).write_text(json.dumps(result, indent=2) + "\n")
+    matrix_file = state.conf.options.min_req_matrix_file
+    if matrix_file is not None:
+        matrix = _deduplicated_matrix(result)
+        Path(matrix_file).write_text(json.dumps(matrix, indent=2) + "\n")
+    for name, data in result.items():
+        print(f"[{name}]")
+        if not data["enabled"]:
+            print(
+                f"# min-req disabled ({data['reason']})"
+                if "reason" in data
+                else "# min-req disabled"
+            )
+        elif "error" in data:
+            print(f"# {data['error']}")
+        else:
+            print(f"# fingerprint: {data['fingerprint']}")
+            for n, v in data["constraints"].items():
+                print(f"{n}=={v}")
+            for line in [*data["learned"], *data["extra_lines"]]:
+                print(line)
+    return 0
+
+
+def min_req_imports(state: State) -> int:
+    """Report dependencies never imported by commands of the selected environments."""
+    reports = []
+    for name in state.envs.iter():
+        report_file = state.envs[name].env_dir / IMPORTS_FILE_NAME
+        if not report_file.exists():
+            continue
+        report = json.loads(report_file.read_text())
+        reports.append(report)
+        unused = unused_dependencies([report])
+        print(f"[{name}] not imported: {', '.join(unused) or '-'}")
+    if not reports:
+        print("no import traces found, run environments with min_req_trace_imports")
+        return 1
+    unused = unused_dependencies(reports)
+    print(f"not imported in any environment: {', '.join(unused) or '-'}")
+    return 0
+
+
+def _snapshot_data(
+    tox_env: PythonRun,
+    dependencies: dict[str, str],
+    extra_lines: list[str],
+    learned: list[str],
+) -> dict[str, Any]:
+    """Describe what the min_req environment installs, independently of its location."""
+    project_path = str(tox_env.core["package_root"])
+    return {
+        "python": [
+            tox_env.base_python.implementation,
+            list(tox_env.base_python.version_info[:3]),
+            tox_env.base_python.platform,
+            tox_env.base_python.machine,
+            tox_env.base_python.is_64,
+        ],
+        "constraints": sorted(dependencies.items()),
+        "extra_lines": [x.replace(project_path, "{project_dir}") for x in extra_lines],
+        "learned": learned,
+        "constraint_files": [
+            hashlib.sha256(x.read_bytes()).hexdigest() if x.is_file() else ""
+            for x in _constraint_files(tox_env, extra_lines)
+        ],
+        "extras": sorted(tox_env.conf["extras"]),
+        "dependency_groups": sorted(tox_env.conf["dependency_groups"]),
+        "deps": tox_env.conf["deps"].lines(),
+    }
+
+
+def _snapshot_env(tox_env: PythonRun, options: Any) -> str:
+    try:
+        constraints = _compute_constraints(tox_env)
+    except (Skip, Fail) as e:
+        return f"skipped, {e}"
+    if constraints is None:  # pragma: no cover
+        return "skipped, no setup.cfg or pyproject.toml found"
+    data = _snapshot_data(tox_env, *constraints)
+    key = snapshot_key(data)
+    file_name = f"{tox_env.name}-{key[:16]}.tar.gz"
+    paths = {"env_dir": str(tox_env.env_dir), "tox_root": str(tox_env.core["tox_root"])}
+
+    if options.min_req_snapshot_export is not None:
+        archive = Path(options.min_req_snapshot_export) / file_name
+        if not tox_env.env_dir.exists():
+            return "skipped, environment is not created"
+        export_snapshot(tox_env.env_dir, archive, {"key": key, "data": data, **paths})
+        return f"exported to {archive}"
+    archive = Path(options.min_req_snapshot_import) / file_name
+    return _import_env_snapshot(tox_env, archive, key, data, paths)
+
+
+def _import_env_snapshot(
+    tox_env: ToxEnv,
+    archive: Path,
+    key: str,
+    data: dict[str, Any],
+    paths: dict[str, str],
+) -> str:
+    if not archive.exists():
+        return "no snapshot for the current constraints"
+    metadata = read_snapshot_metadata(archive)
+    # compare after JSON round trip, as tuples are stored as lists
+    if metadata.get("key") != key or metadata.get("data") != json.loads(
+        json.dumps(data)
+    ):
+        return f"snapshot {archive} does not match the current constraints, ignored"
+    import_snapshot(archive, tox_env.env_dir, paths)
+    return f"restored from {archive}"
+
+
+def min_req_snapshot(state: State) -> int:
+    """Export or import snapshots of the installed min_req environments."""
+    options = state.conf.options
+    if (options.min_req_snapshot_export is None) == (
+        options.min_req_snapshot_import is None
+    ):
+        print("use exactly one of --export or --import")
+        return 1
+    for name in state.envs.iter():
+        tox_env = _min_req_env(state.envs[name])
+        if tox_env is not None:
+            print(f"{name}: {_snapshot_env(tox_env, options)}")
+    return 0
+
+
+def min_req_sample(state: State) -> int:
+    """Print the covering set of version assignments of the selected environments."""
+    for name in state.envs.iter():
+        tox_env = _min_req_env(state.envs[name])
+        if tox_env is None:
+            continue
+        try:
+            assignments = _sample_assignments(tox_env)
+        except (Skip, Fail) as e:
+            print(f"[{name}]\n# {e}")
+            continue
+        print(
+            f"[{name}]\n# {len(assignments)} assignments "
+            f"(strength {tox_env.conf['min_req_sample_strength']}, "
+            f"seed {tox_env.conf['min_req_sample_seed']})"
+        )
+        for i, assignment in enumerate(assignments):
+            pins = " ".join(f"{n}=={v}" for n, v in assignment.items())
+            print(f"{i}: {pins}")
+    return 0
+
+
+def _metadata_store(options: Any, work_dir: Path) -> MetadataStore:
+    if options.min_req_store_path:
+        path = Path(options.min_req_store_path)
+    elif os.environ.get("TOX_MIN_REQ_STORE", ""):
+        path = Path(os.environ["TOX_MIN_REQ_STORE"])
+    else:
+        path = work_dir / STORE_FILE_NAME
+    return MetadataStore(path, max_entries=options.min_req_store_max_entries)
+
+
+def min_req_store(state: State) -> int:
+    """Fill, import or export the package metadata store."""
+    options = state.conf.options
+    store = _metadata_store(options, state.conf.core["work_dir"])
+    if options.min_req_store_import is not None:
+        count = store.import_json(options.min_req_store_import)
+        print(f"imported {count} entries from {options.min_req_store_import}")
+    for directory in options.min_req_store_fill:
+        count = store.fill_from_directory(directory)
+        print(f"added {count} wheels from {directory}")
+    if options.min_req_store_export is not None:
+        count = store.export_json(options.min_req_store_export)
+        print(f"exported {count} entries to {options.min_req_store_export}")
+    print(f"{store.path}: {len(store)} entries")
+    return 0
+
+
+def _forget_installs(env_dir: Path) -> None:
+    """
+    Drop the records of installed dependencies from the tox cache of the environment.
+
+    tox reinstalls ``deps`` and package dependencies only when their records
+    changed, and most tox versions do not include environment variables like
+    ``PIP_CONSTRAINT`` in them, so without this a reused environment would keep
+    the versions of its first run. The record of the interpreter is kept,
+    so the environment is not recreated.
+    """
+    info_file = env_dir / ".tox-info.json"
+    try:
+        info = json.loads(info_file.read_text())
+    except (OSError, ValueError):
+        return
+    for section in ("PythonRun", "RunToxEnv"):
+        info.pop(section, None)
+    info_file.write_text(json.dumps(info, indent=2))
+
+
+def _bisect_test(
+    state: State, tox_env: ToxEnv, jobs: int
+) -> Callable[[list[str]], bool]:
+    """
+    Create a test running the environment with only the given pins applied.
+
+    Every parallel job uses its own tox working directory, so the virtual
+    environments are reused between tests. Before each test, the records
+    of installed dependencies are dropped (see :func:`_forget_installs`), so tox
+    installs them again, and the pip upgrade mode makes released pins follow
+    to the latest versions in the reused environments.
+    """
+    bisect_dir = tox_env.core["work_dir"] / BISECT_DIR_NAME / tox_env.name
+    try:
+        env_dir = tox_env.env_dir.relative_to(tox_env.core["work_dir"])
+    except ValueError:
+        env_dir = Path(tox_env.name)
+    slots: queue.Queue[Path] = queue.Queue()
+    for i in range(jobs):
+        slots.put(bisect_dir / f"job{i}")
+    counter = itertools.count()
+
+    def test(pins: list[str]) -> bool:
+        run_id = next(counter)
+        slot = slots.get()
+        try:
+            slot.mkdir(parents=True, exist_ok=True)
+            _forget_installs(slot / ".tox" / env_dir)
+            env = {
+                **os.environ,
+                SUBSET_ENV: ",".join(pins),
+                "PIP_UPGRADE": "1",
+                # unique per run, so the constraints of each test are kept next
+                # to its log, and tox versions that include PIP_CONSTRAINT in
+                # the install records see a change even for equal pin sets
+                "TOX_MIN_REQ_CONSTRAINTS": str(slot / f"constraints_{run_id}.txt"),
+            }
+            cmd = [
+                sys.executable,
+                "-m",
+                "tox",
+                "run",
+                "-e",
+                tox_env.name,
+                "-c",
+                str(state.conf.src_path),
+                "--workdir",
+                str(slot / ".tox"),
+            ]
+            with (slot / f"run_{run_id}.log").open("w") as log:
+                result = subprocess.run(
+                    cmd,
+                    cwd=tox_env.core["tox_root"],
+                    env=env,
+                    stdout=log,
+                    stderr=subprocess.STDOUT,
+                    check=False,
+                )
+        finally:
+            slots.put(slot)
+        failed = result.returncode != 0
+        print(
+            f"{tox_env.name}: {'fail' if failed else 'pass'} with {len(pins)} pins "
+            f"({slot / f'run_{run_id}.log'})",
+            flush=True,
+        )
+        return failed
+
+    return test
+
+
+def min_req_bisect(state: State) -> int:
+    """Find the minimal set of pins reproducing the failure of the selected environments."""
+    jobs = state.conf.options.min_req_bisect_jobs
+    exit_code = 0
+    for name in state.envs.iter():
+        tox_env = _min_req_env(state.envs[name])
+        if tox_env is None:
+            continue
+        constraints = _compute_constraints(tox_env)
+        if constraints is None:  # pragma: no cover
+            continue
+        dependencies = constraints[0]
+        test = _bisect_test(state, tox_env, jobs)
+        if not test(list(dependencies)):
+            print(f"{name}: the failure does not reproduce")
+            exit_code = 1
+            continue
+        if test([]):
+            print(f"{name}: the failure reproduces without any pin")
+            exit_code = 1
+            continue
+        pins = ddmin(list(dependencies), test, jobs)
+        print(
+            f"{name}: minimal set of pins reproducing the failure: "
+            + ", ".join(f"{x}=={dependencies[x]}" for x in pins)
+        )
+    return exit_code
+
+
+def _watched_files(tox_env: ToxEnv) -> set[Path]:
+    # files referenced by -r/-c lines are not watched, as they are not inlined,
+    # pip reads them during the installation
+    project_path = tox_env.core["package_root"]
+    files = {project_path / "setup.cfg", project_path / "pyproject.toml"}
+    return {x.absolute() for x in files}
+
+
+def _refresh_constraints(
+    tox_env: PythonRun, written: dict[Path, str], sources: dict[str, set[Path]]
+) -> None:
+    """
+    Rewrite the constraints file of the environment if its content changed.
+
+    :param tox_env: tox environment to refresh constraints for
+    :param written: last known content of the constraints files, updated in place
+    :param sources: files the constraints of environments depend on, updated in place
+    """
+    start = time.perf_counter()
+    try:
+        constraints = _compute_constraints(tox_env)
+    except Exception as e:  # file could be saved in the middle of editing
+        logging.error("min-req %s: constraints not updated: %s", tox_env.name, e)
+        sources.setdefault(tox_env.name, _watched_files(tox_env))
+        return
+    if constraints is None:  # pragma: no cover
+        sources[tox_env.name] = _watched_files(tox_env)
+        return
+    dependencies, extra_lines, learned = constraints
+    sources[tox_env.name] = _watched_files(tox_env)
+
+    path = _constraints_path(tox_env)
+    content = _format_constraints(dependencies, extra_lines, learned)
+    if path not in written and path.is_file():
+        written[path] = path.read_text()
+    if written.get(path) == content:
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+    written[path] = content
+    duration = (time.perf_counter() - start) * 1000
+    print(f"{tox_env.name}: updated {path} ({duration:.1f} ms)", flush=True)
+
+
+def min_req_watch(state: State) -> int:
+    """Regenerate constraints files of the selected environments on project changes."""
+    options = state.conf.options
+    envs = [
+        tox_env
+        for tox_env in (_min_req_env(state.envs[name]) for name in state.envs.iter())
+        if tox_env is not None
+    ]
+    written: dict[Path, str] = {}
+    sources: dict[str, set[Path]] = {}
+    for tox_env in envs:
+        _refresh_constraints(tox_env, written, sources)
+    if options.min_req_watch_once:
+        return 0
+
+    watched = set().union(*sources.values())
+    watcher = create_watcher(watched, options.min_req_watch_interval)
+    print(f"watching {len(watched)} files, press Ctrl+C to stop", flush=True)
+    try:
+        while True:
+            changed = watcher.wait()
+            for tox_env in envs:
+                if sources[tox_env.name] & changed:
+                    _refresh_constraints(tox_env, written, sources)
+            new_watched = set().union(*sources.values())
+            if new_watched != watched:
+                watcher.close()
+                watched = new_watched
+                watcher = create_watcher(watched, options.min_req_watch_interval)
+    except KeyboardInterrupt:
+        return 0
+    finally:
+        watcher.close()
 
 
 @impl
@@ -109,6 +1127,13 @@ def tox_add_env_config(env_conf: EnvConfigSet, state: State) -> None:
         default=False,
         desc="Set to true to use the minimum required version of the dependencies",
     )
+    env_conf.add_config(
+        keys=["min_req_build"],
+        of_type=bool,
+        default=False,
+        desc="Set to true in the packaging environment to install the minimum "
+        "required versions of build-system.requires",
+    )
     env_conf.add_config(
         keys=["min_req_constraints"],
         of_type=str,
@@ -116,6 +1141,76 @@ def tox_add_env_config(env_conf: EnvConfigSet, state: State) -> None:
         desc="List of additional constraints to use when min_req is set to true, "
         "could override the minimum required version of the dependencies",
     )
+    env_conf.add_config(
+        keys=["min_req_install_report"],
+        of_type=bool,
+        default=False,
+        desc="Set to true to report download and build time of each package "
+        "installed in the min_req environment (pip only)",
+    )
+    env_conf.add_config(
+        keys=["min_req_learn_pins"],
+        of_type=bool,
+        default=False,
+        desc="Set to true to learn indirect pins from pip backtracking and conflicts "
+        "and use them in the next runs of the min_req environment (pip only)",
+    )
+    env_conf.add_config(
+        keys=["min_req_prefetch"],
+        of_type=bool,
+        default=False,
+        desc="Set to true to download wheels of the pinned versions in background, "
+        "while the dependencies are installed and the package is built",
+    )
+    env_conf.add_config(
+        keys=["min_req_trace_imports"],
+        of_type=bool,
+        default=False,
+        desc="Set to true to record which dependencies are imported by commands "
+        "of the min_req environment",
+    )
+    env_conf.add_config(
+        keys=["min_req_python"],
+        of_type=str,
+        default="all",
+        desc="Interpreters on which the minimum requirements are tested: all, "
+        "oldest (only the oldest one allowed by requires-python) or installable "
+        "(the oldest one and newer ones, on which the minimum versions install)",
+    )
+    env_conf.add_config(
+        keys=["min_req_python_wheel_tags"],
+        of_type=bool,
+        default=False,
+        desc="Set to true to treat minimum versions without a compatible wheel "
+        "in the package metadata store as not installable for min_req_python",
+    )
+    env_conf.add_config(
+        keys=["min_req_sample"],
+        of_type=str,
+        default="",
+        desc="Index of the version assignment from the covering set to use "
+        "instead of the minimum versions",
+    )
+    env_conf.add_config(
+        keys=["min_req_sample_seed"],
+        of_type=int,
+        default=0,
+        desc="Seed used to generate the covering set of version assignments",
+    )
+    env_conf.add_config(
+        keys=["min_req_sample_strength"],
+        of_type=int,
+        default=2,
+        desc="Number of dependencies whose version combinations are all covered "
+        "by the set of version assignments",
+    )
+    env_conf.add_config(
+        keys=["min_req_skip_unchanged"],
+        of_type=bool,
+        default=False,
+        desc="Set to true to skip the min_req environment if neither the constraints "
+        "nor the project source changed since its last successful run",
+    )
 
 
 @impl
@@ -128,3 +1223,171 @@ def tox_add_option(parser: ToxParser) -> None:
         "If not set, the constraints file will be created in the tox temporary directory. "
         "Because of pip using space as separator, the path should not contain spaces.",
     )
+    parser.add_argument(
+        "--min-req-skip-duplicates",
+        action="store_true",
+        default=False,
+        help="Skip min-req environments whose fingerprint (interpreter, constraints, "
+        "deps and commands) is the same as of an environment that already run.",
+    )
+    parser.add_argument(
+        "--min-req-store-path",
+        type=str,
+        default="",
+        help="Path to the package metadata store database. "
+        "If not set, the TOX_MIN_REQ_STORE environment variable is used, "
+        "or the store is created in the tox working directory.",
+    )
+    parser.add_argument(
+        "--min-req-store-max-entries",
+        type=int,
+        default=10_000,
+        help="Maximum number of (name, version) entries kept in the metadata store. "
+        "The least recently used entries are evicted first.",
+    )
+    our = parser.add_command(
+        "min-req-dry-run",
+        [],
+        "print the minimum requirements constraints of environments "
+        "without provisioning them",
+        min_req_dry_run,
+    )
+    our.add_argument(
+        "-o",
+        "--output-file",
+        of_type=Path,
+        default=None,
+        dest="min_req_output_file",
+        help="Also dump the constraints of every environment as JSON to this file.",
+    )
+    our.add_argument(
+        "--matrix",
+        of_type=Path,
+        default=None,
+        dest="min_req_matrix_file",
+        help="Dump JSON list of environments to run in CI, where environments "
+        "with the same min-req fingerprint are listed only once.",
+    )
+    register_env_select_flags(our, default=CliEnv())
+    env_run_create_flags(our, mode="config")
+
+    our = parser.add_command(
+        "min-req-bisect",
+        [],
+        "find the minimal set of minimum requirements pins for which "
+        "the environment fails, releasing other pins to the latest versions",
+        min_req_bisect,
+    )
+    our.add_argument(
+        "--jobs",
+        type=int,
+        default=min(4, os.cpu_count() or 1),
+        dest="min_req_bisect_jobs",
+        help="Number of environment runs executed in parallel.",
+    )
+    register_env_select_flags(our, default=CliEnv())
+    env_run_create_flags(our, mode="config")
+
+    our = parser.add_command(
+        "min-req-watch",
+        [],
+        "keep the constraints files of environments up to date "
+        "while pyproject.toml or setup.cfg are edited",
+        min_req_watch,
+    )
+    our.add_argument(
+        "--once",
+        action="store_true",
+        default=False,
+        dest="min_req_watch_once",
+        help="Write the constraints files and exit without watching.",
+    )
+    our.add_argument(
+        "--interval",
+        type=float,
+        default=0.1,
+        dest="min_req_watch_interval",
+        help="Time in seconds between checks of files, "
+        "used only if watchdog is not installed.",
+    )
+    register_env_select_flags(our, default=CliEnv())
+    env_run_create_flags(our, mode="config")
+
+    our = parser.add_command(
+        "min-req-imports",
+        [],
+        "report dependencies not imported by commands of environments "
+        "run with min_req_trace_imports",
+        min_req_imports,
+    )
+    register_env_select_flags(our, default=CliEnv())
+    env_run_create_flags(our, mode="config")
+
+    our = parser.add_command(
+        "min-req-sample",
+        [],
+        "print the covering set of version assignments used by min_req_sample",
+        min_req_sample,
+    )
+    register_env_select_flags(our, default=CliEnv())
+    env_run_create_flags(our, mode="config")
+
+    our = parser.add_command(
+        "min-req-snapshot",
+        [],
+        "export or import installed min-req environments, e.g. to save them in CI cache",
+        min_req_snapshot,
+    )
+    our.add_argument(
+        "--export",
+        of_type=Path,
+        default=None,
+        dest="min_req_snapshot_export",
+        metavar="dir",
+        help="Save snapshots of created environments to the directory.",
+    )
+    our.add_argument(
+        "--import",
+        of_type=Path,
+        default=None,
+        dest="min_req_snapshot_import",
+        metavar="dir",
+        help="Restore environments from snapshots in the directory "
+        "that match the current constraints.",
+    )
+    register_env_select_flags(our, default=CliEnv())
+    env_run_create_flags(our, mode="config")
+
+    our = parser.add_command(
+        "min-req-store",
+        [],
+        "manage the package metadata store used by tox-min-req",
+        min_req_store,
+        inherit=frozenset({CORE}),
+    )
+    our.add_argument(
+        "--fill",
+        nargs="+",
+        default=[],
+        type=Path,
+        dest="min_req_store_fill",
+        metavar="dir",
+        help="Add metadata of all wheel files found in the given directories "
+        "(wheelhouse, pip wheel cache, static simple index).",
+    )
+    our.add_argument(
+        "--import",
+        of_type=Path,
+        default=None,
+        dest="min_req_store_import",
+        metavar="path",
+        help="Import entries from a JSON file created by --export.",
+    )
+    our.add_argument(
+        "--export",
+        of_type=Path,
+        default=None,
+        dest="min_req_store_export",
+        metavar="path",
+        help="Export all entries to a JSON file, e.g. to save them in CI cache.",
+    )
@@ -0,0 +1,153 @@
+"""Module to watch project configuration files for changes."""
+
+from __future__ import annotations
+
+import importlib.util
+import queue
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from watchdog.events import FileSystemEvent, FileSystemEventHandler
+
+__all__ = (
+    "PollingWatcher",
+    "WatchdogWatcher",
+    "create_watcher",
+)
+
+
+def _stat(path: Path) -> tuple[int, int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class PollingWatcher:
+    """
+    Watch files by periodically checking their modification time and size.
+
+    Missing files are watched too, so their creation is reported as a change.
+
+    :param paths: paths of files to watch
+    :param interval: time in seconds between checks
+    """
+
+    def __init__(self, paths: Iterable[str | Path], interval: float = 0.1) -> None:
+        self.interval = interval
+        self._stats = {Path(x): _stat(Path(x)) for x in paths}
+
+    def poll(self) -> set[Path]:
+        """Return files changed since the last check, without waiting."""
+        changed = set()
+        for path, old in self._stats.items():
+            new = _stat(path)
+            if new != old:
+                self._stats[path] = new
+                changed.add(path)
+        return changed
+
+    def wait(self, timeout: float | None = None) -> set[Path]:
+        """
+        Wait until some of the files change.
+
+        :param timeout: maximum time to wait in seconds, None to wait forever
+        :return: changed files, empty if the timeout passed
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            changed = self.poll()
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return changed
+            time.sleep(self.interval)
+
+    def close(self) -> None:
+        """Stop watching."""
+
+
+def _queue_handler(events: queue.Queue[Path]) -> FileSystemEventHandler:
+    """Create a watchdog handler putting paths of all events to the queue."""
+    from watchdog.events import FileSystemEventHandler  # noqa: PLC0415
+
+    class _QueueHandler(FileSystemEventHandler):
+        def on_any_event(self, event: FileSystemEvent) -> None:
+            for path in (event.src_path, event.dest_path):
+                if path:
+                    events.put(Path(str(path)))
+
+    return _QueueHandler()
+
+
+class WatchdogWatcher:
+    """
+    Watch files using notifications of the operating system (inotify, FSEvents, ...).
+
+    Directories containing the files are watched, so files replaced
+    by editors on save, or created later, are reported too.
+
+    :param paths: paths of files to watch
+    :param debounce: time in seconds to collect events that belong to a single save
+    """
+
+    def __init__(self, paths: Iterable[str | Path], debounce: float = 0.01) -> None:
+        self.debounce = debounce
+        self._paths = {Path(x).absolute() for x in paths}
+        from watchdog.observers import Observer  # noqa: PLC0415
+
+        self._events: queue.Queue[Path] = queue.Queue()
+        self._observer = Observer()
+        handler = _queue_handler(self._events)
+        for directory in {x.parent for x in self._paths if x.parent.is_dir()}:
+            self._observer.schedule(handler, str(directory))
+        self._observer.start()
+
+    def wait(self, timeout: float | None = None) -> set[Path]:
+        """
+        Wait until some of the files change.
+
+        :param timeout: maximum time to wait in seconds, None to wait forever
+        :return: changed files, empty if the timeout passed
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        changed: set[Path] = set()
+        while not changed:
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                break
+            try:
+                path = self._events.get(timeout=remaining)
+            except queue.Empty:
+                break
+            changed.add(path.absolute())
+            time.sleep(self.debounce)
+            while not self._events.empty():
+                changed.add(self._events.get().absolute())
+            changed &= self._paths
+        return changed
+
+    def close(self) -> None:
+        """Stop watching."""
+        self._observer.stop()
+        self._observer.join()
+
+
+def create_watcher(
+    paths: Iterable[str | Path], interval: float = 0.1
+) -> PollingWatcher | WatchdogWatcher:
+    """
+    Create a watcher of the files.
+
+    Operating system notifications are used if ``watchdog`` is installed,
+    otherwise the files are polled.
+
+    :param paths: paths of files to watch
+    :param interval: time in seconds between checks of the polling watcher
+    """
+    if importlib.util.find_spec("watchdog") is None:  # pragma: no cover
+        return PollingWatcher(paths, interval)
+    return WatchdogWatcher(paths)